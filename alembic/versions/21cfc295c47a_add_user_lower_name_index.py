@@ -0,0 +1,29 @@
+"""add user lower name index
+
+Revision ID: 21cfc295c47a
+Revises: e5805272f372
+Create Date: 2026-10-15 22:22:14.246831
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '21cfc295c47a'
+down_revision = 'e5805272f372'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_user_name_lower",
+        "users",
+        [sa.text("lower(name)")],
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_user_name_lower", table_name="users", if_exists=True) 
\ No newline at end of file
@@ -0,0 +1,47 @@
+"""make hashed password nullable
+
+Revision ID: 6910100b0a21
+Revises: 9cf4014b087d
+Create Date: 2026-10-15 22:24:43.049129
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '6910100b0a21'
+down_revision = '9cf4014b087d'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # batch mode so SQLite can recreate the table to change nullability
+    with op.batch_alter_table("users") as batch_op:
+        batch_op.alter_column(
+            "hashed_password", existing_type=sa.String(), nullable=True
+        )
+    # SQLite reflection skips expression indexes, so the table rebuild
+    # above drops it; put it back
+    op.create_index(
+        "ix_user_name_lower",
+        "users",
+        [sa.text("lower(name)")],
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    # Discord-only accounts get an unusable "!" hash back
+    op.execute("UPDATE users SET hashed_password = '!' WHERE hashed_password IS NULL")
+    with op.batch_alter_table("users") as batch_op:
+        batch_op.alter_column(
+            "hashed_password", existing_type=sa.String(), nullable=False
+        )
+    op.create_index(
+        "ix_user_name_lower",
+        "users",
+        [sa.text("lower(name)")],
+        if_not_exists=True,
+    ) 
\ No newline at end of file
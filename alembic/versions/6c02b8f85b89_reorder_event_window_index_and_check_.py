@@ -0,0 +1,42 @@
+"""reorder event window index and check time window
+
+Revision ID: 6c02b8f85b89
+Revises: c9bfeb1a6ba5
+Create Date: 2026-10-15 22:29:17.088860
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '6c02b8f85b89'
+down_revision = 'c9bfeb1a6ba5'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.drop_index("ix_event_active_window", table_name="events", if_exists=True)
+    op.create_index(
+        "ix_event_window",
+        "events",
+        ["is_active", "end_time", "start_time"],
+        if_not_exists=True,
+    )
+    # batch mode so SQLite can recreate the table to add the constraint
+    with op.batch_alter_table("events") as batch_op:
+        batch_op.create_check_constraint(
+            "ck_event_time_window", "start_time < end_time"
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("events") as batch_op:
+        batch_op.drop_constraint("ck_event_time_window", type_="check")
+    op.drop_index("ix_event_window", table_name="events", if_exists=True)
+    op.create_index(
+        "ix_event_active_window",
+        "events",
+        ["is_active", "start_time", "end_time"],
+        if_not_exists=True,
+    ) 
\ No newline at end of file
@@ -0,0 +1,30 @@
+"""add event channel index
+
+Revision ID: 9cf4014b087d
+Revises: 21cfc295c47a
+Create Date: 2026-10-15 22:24:08.671282
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9cf4014b087d'
+down_revision = '21cfc295c47a'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_event_channel_active",
+        "events",
+        ["discord_channel_id", "is_active"],
+        postgresql_where=sa.text("is_active"),
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_event_channel_active", table_name="events", if_exists=True) 
\ No newline at end of file
@@ -0,0 +1,26 @@
+"""drop redundant primary key indexes
+
+Revision ID: b08efe99bec8
+Revises: ddaec446b6e0
+Create Date: 2026-10-15 22:50:00.327853
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'b08efe99bec8'
+down_revision = 'ddaec446b6e0'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # The primary keys are already indexed; these only slowed down writes
+    op.drop_index("ix_users_id", table_name="users", if_exists=True)
+    op.drop_index("ix_events_id", table_name="events", if_exists=True)
+
+
+def downgrade() -> None:
+    op.create_index("ix_events_id", "events", ["id"], if_not_exists=True)
+    op.create_index("ix_users_id", "users", ["id"], if_not_exists=True)
@@ -0,0 +1,30 @@
+"""add attendance event index
+
+Revision ID: c9bfeb1a6ba5
+Revises: 6910100b0a21
+Create Date: 2026-10-15 22:28:26.361908
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'c9bfeb1a6ba5'
+down_revision = '6910100b0a21'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_att_event_user",
+        "user_event_attendance",
+        ["event_id", "user_id"],
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_att_event_user", table_name="user_event_attendance", if_exists=True
+    ) 
\ No newline at end of file
@@ -0,0 +1,47 @@
+"""make event time indexes partial on postgresql
+
+Revision ID: ddaec446b6e0
+Revises: 6c02b8f85b89
+Create Date: 2026-10-15 22:35:51.796848
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'ddaec446b6e0'
+down_revision = '6c02b8f85b89'
+branch_labels = None
+depends_on = None
+
+
+# Only inactive (archived) events are left out, so every query that filters
+# on is_active can use them
+_PARTIAL_INDEXES = {
+    "ix_event_window": ["is_active", "end_time", "start_time"],
+    "ix_event_active_start": ["is_active", "start_time"],
+}
+
+
+def _recreate(partial: bool) -> None:
+    # Partial indexes are PostgreSQL-only in the models; nothing to do elsewhere
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    for name, columns in _PARTIAL_INDEXES.items():
+        op.drop_index(name, table_name="events", if_exists=True)
+        op.create_index(
+            name,
+            "events",
+            columns,
+            postgresql_where=sa.text("is_active") if partial else None,
+            if_not_exists=True,
+        )
+
+
+def upgrade() -> None:
+    _recreate(partial=True)
+
+
+def downgrade() -> None:
+    _recreate(partial=False)
@@ -0,0 +1,35 @@
+"""add event active window indexes
+
+Revision ID: e5805272f372
+Revises: 
+Create Date: 2026-10-15 22:19:09.303967
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'e5805272f372'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_event_active_window",
+        "events",
+        ["is_active", "start_time", "end_time"],
+        if_not_exists=True,
+    )
+    op.create_index(
+        "ix_event_active_start",
+        "events",
+        ["is_active", "start_time"],
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_event_active_start", table_name="events", if_exists=True)
+    op.drop_index("ix_event_active_window", table_name="events", if_exists=True) 
\ No newline at end of file
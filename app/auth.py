@@ -1,3 +1,6 @@
+import hashlib
+import time
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Optional
 
@@ -5,17 +8,33 @@ from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from jose import JWTError, jwt
 from passlib.context import CryptContext
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app import models, schemas
-from app.config import settings
+from app.cache import TTLCache
+from app.config import Settings, get_settings
 from app.database import get_db
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 security = HTTPBearer()
 
+# sha256(token) -> (exp timestamp, UserClaims) for recently verified tokens
+_token_cache = TTLCache(ttl=get_settings().token_cache_ttl, maxsize=10000)
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
+
+@dataclass(frozen=True, slots=True)
+class UserClaims:
+    """The user as recorded in the access token, for handlers that need no row"""
+    id: int
+    is_active: bool = True
+    is_admin: bool = False
+
+
+def verify_password(plain_password: str, hashed_password: Optional[str]) -> bool:
+    if not hashed_password:
+        # Discord-only accounts have no password and can never log in
+        return False
     return pwd_context.verify(plain_password, hashed_password)
 
 
@@ -30,12 +49,15 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     else:
         expire = datetime.utcnow() + timedelta(minutes=15)
     to_encode.update({"exp": expire})
+    settings = get_settings()
     encoded_jwt = jwt.encode(to_encode, settings.secret_key, algorithm=settings.algorithm)
     return encoded_jwt
 
 
 def get_user_by_email(db: Session, email: str):
-    return db.query(models.User).filter(models.User.email == email).first()
+    return db.scalars(
+        select(models.User).where(models.User.email == email)
+    ).first()
 
 
 def authenticate_user(db: Session, email: str, password: str):
@@ -47,30 +69,85 @@ def authenticate_user(db: Session, email: str, password: str):
     return user
 
 
-async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db)
-):
-    credentials_exception = HTTPException(
+def create_user_access_token(user: models.User) -> str:
+    """Access token carrying the claims get_current_user_claims reads back"""
+    return create_access_token(data={
+        "sub": user.email,
+        "uid": user.id,
+        "active": user.is_active,
+        "admin": user.is_admin,
+    })
+
+
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
+
+
+def get_current_user_claims(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: Session = Depends(get_db),
+    settings: Settings = Depends(get_settings)
+) -> UserClaims:
+    """Verify the bearer token and return its claims without loading the user
+
+    Claims are as of login: a user deactivated since then keeps read access
+    until the token expires. Tokens issued before the claims were added are
+    resolved once by email. Plain def: that fallback uses the blocking Session.
+    """
+    token_key = hashlib.sha256(credentials.credentials.encode()).digest()
+    cached = _token_cache.get(token_key)
+    if cached is not None:
+        exp, claims = cached
+        if exp > time.time():
+            return claims
+        _token_cache.pop(token_key)
+
     try:
         payload = jwt.decode(credentials.credentials, settings.secret_key, algorithms=[settings.algorithm])
         email: str = payload.get("sub")
         if email is None:
-            raise credentials_exception
+            raise _credentials_exception()
         token_data = schemas.TokenData(email=email)
     except JWTError:
-        raise credentials_exception
-    user = get_user_by_email(db, email=token_data.email)
+        raise _credentials_exception()
+
+    if "uid" in payload:
+        claims = UserClaims(
+            id=payload["uid"],
+            is_active=payload.get("active", True),
+            is_admin=payload.get("admin", False),
+        )
+    else:
+        user = get_user_by_email(db, email=token_data.email)
+        if user is None:
+            raise _credentials_exception()
+        claims = UserClaims(id=user.id, is_active=user.is_active, is_admin=user.is_admin)
+    _token_cache.set(token_key, (payload["exp"], claims))
+    return claims
+
+
+def get_current_user(
+    claims: UserClaims = Depends(get_current_user_claims),
+    db: Session = Depends(get_db)
+):
+    # The user is reloaded so is_active/is_admin changes apply at once
+    user = db.get(models.User, claims.id)
     if user is None:
-        raise credentials_exception
+        raise _credentials_exception()
     return user
 
 
 async def get_current_active_user(current_user: models.User = Depends(get_current_user)):
     if not current_user.is_active:
         raise HTTPException(status_code=400, detail="Inactive user")
-    return current_user 
\ No newline at end of file
+    return current_user
+
+
+async def get_current_active_claims(claims: UserClaims = Depends(get_current_user_claims)):
+    if not claims.is_active:
+        raise HTTPException(status_code=400, detail="Inactive user")
+    return claims 
\ No newline at end of file
@@ -0,0 +1,49 @@
+import threading
+import time
+from typing import Any, Dict, Hashable, Tuple
+
+
+class TTLCache:
+    """Small thread-safe, process-local cache whose entries expire after `ttl` seconds"""
+
+    def __init__(self, ttl: float, maxsize: int = 1024):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data: Dict[Hashable, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        if self.ttl <= 0:
+            return
+        with self._lock:
+            if key not in self._data and len(self._data) >= self.maxsize:
+                self._evict()
+            self._data[key] = (time.monotonic() + self.ttl, value)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.pop(key, None)
+        return default if entry is None else entry[1]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def _evict(self) -> None:
+        # Drop expired entries first; if still full, drop the oldest insert
+        now = time.monotonic()
+        for key in [k for k, (exp, _) in self._data.items() if exp <= now]:
+            del self._data[key]
+        if len(self._data) >= self.maxsize:
+            self._data.pop(next(iter(self._data)))
@@ -1,11 +1,28 @@
-from pydantic_settings import BaseSettings
+from functools import lru_cache
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
+    model_config = SettingsConfigDict(env_file=".env", frozen=True)
+
     database_url: str = "sqlite:///./app.db"
+    # Connections per worker process; keep
+    # workers * (db_pool_size + db_max_overflow) below the server's max_connections
+    db_pool_size: int = 20
+    db_max_overflow: int = 40
+    db_pool_timeout: float = 10.0  # Seconds to wait for a free connection
     secret_key: str = "your-secret-key-change-in-production"
     algorithm: str = "HS256"
     access_token_expire_minutes: int = 30
+    auto_create_tables: bool = True  # Run create_all on startup
+    active_events_cache_ttl: float = 5.0  # Seconds; 0 disables the cache
+    # Seconds; each worker clears only its own caches on writes, so other
+    # workers may serve stale event listings this long. 0 disables
+    event_listings_cache_ttl: float = 5.0
+    cors_origins: str = "*"  # Comma-separated allowed origins
+    token_cache_ttl: float = 30.0  # Seconds a verified JWT is remembered; 0 disables
+    attendance_cache_ttl: float = 30.0  # Seconds a positive attendance check is remembered; 0 disables
     
     # Discord settings
     discord_bot_token: str = ""
@@ -13,8 +30,8 @@ class Settings(BaseSettings):
     admin_api_token: str = ""
     api_base_url: str = "http://localhost:8000"
 
-    class Config:
-        env_file = ".env"
-
 
-settings = Settings() 
\ No newline at end of file
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Parse the environment once and reuse the settings (FastAPI dependency)"""
+    return Settings()
@@ -1,33 +1,105 @@
-from datetime import datetime
-from typing import List, Optional, Tuple
+from datetime import datetime, timedelta
+from typing import Iterator, List, Optional, Sequence, Tuple, Union
 
+from sqlalchemy import Row, RowMapping, bindparam, exists, func, insert, literal, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from app import models, schemas
 from app.auth import get_password_hash
+from app.cache import TTLCache
+from app.config import get_settings
+
+
+# Dialect inserts with ON CONFLICT support
+_INSERT_BY_DIALECT = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+
+# Running/about-to-start events, shared across requests (see get_active_events)
+_active_events_cache = TTLCache(
+    ttl=get_settings().active_events_cache_ttl, maxsize=1
+)
+
+# Event listings polled by the bot, keyed by query
+_event_listings_cache = TTLCache(
+    ttl=get_settings().event_listings_cache_ttl, maxsize=1024
+)
+
+# Per-event snapshots used for attendance validation; writes only clear the
+# worker that made them, so these share the short active-events TTL
+_event_snapshot_cache = TTLCache(
+    ttl=get_settings().active_events_cache_ttl, maxsize=1024
+)
+
+# Positive attendance checks only: attendance rows are never deleted, so a
+# "yes" cannot go stale while a "no" must always be re-checked
+_attendance_cache = TTLCache(
+    ttl=get_settings().attendance_cache_ttl, maxsize=10000
+)
+
+
+def clear_event_caches() -> None:
+    _active_events_cache.clear()
+    _event_listings_cache.clear()
+    _event_snapshot_cache.clear()
+    _attendance_cache.clear()
+
+
+def _now(db: Session) -> datetime:
+    """Request-scoped "now": one clock read shared by all checks in a session"""
+    now = db.info.get("now")
+    if now is None:
+        now = db.info["now"] = datetime.now()
+    return now
+
+
+def _local_naive(value: datetime) -> datetime:
+    """A column datetime as naive local time, comparable with _now()
+
+    DateTime(timezone=True) columns come back aware on PostgreSQL and naive
+    (already local) on SQLite.
+    """
+    return value if value.tzinfo is None else value.astimezone().replace(tzinfo=None)
+
+
+# Hot lookups built once at import; only the bound parameters change per call
+_SELECT_USER_BY_EMAIL = select(models.User).where(
+    models.User.email == bindparam("email")
+)
+_SELECT_USER_BY_DISCORD_ID = select(models.User).where(
+    models.User.discord_user_id == bindparam("discord_user_id")
+)
 
 
 # User CRUD operations
 def get_user(db: Session, user_id: int) -> Optional[models.User]:
-    return db.query(models.User).filter(models.User.id == user_id).first()
+    return db.get(models.User, user_id)
 
 
 def get_user_by_email(db: Session, email: str) -> Optional[models.User]:
-    return db.query(models.User).filter(models.User.email == email).first()
+    return db.execute(
+        _SELECT_USER_BY_EMAIL, {"email": email}
+    ).scalar_one_or_none()
 
 
 def get_user_by_discord_id(
     db: Session, discord_user_id: str
 ) -> Optional[models.User]:
-    return db.query(models.User).filter(
-        models.User.discord_user_id == discord_user_id
-    ).first()
+    return db.execute(
+        _SELECT_USER_BY_DISCORD_ID, {"discord_user_id": discord_user_id}
+    ).scalar_one_or_none()
 
 
 def get_users(
     db: Session, skip: int = 0, limit: int = 100
 ) -> List[models.User]:
-    return db.query(models.User).offset(skip).limit(limit).all()
+    return db.scalars(
+        select(models.User).offset(skip).limit(limit)
+    ).all()
 
 
 def create_user(db: Session, user: schemas.UserCreate) -> models.User:
@@ -35,8 +107,6 @@ def create_user(db: Session, user: schemas.UserCreate) -> models.User:
     db_user = models.User(
         email=user.email,
         name=user.name,
-        discord_user_id=user.discord_user_id,
-        discord_username=user.discord_username,
         hashed_password=hashed_password
     )
     db.add(db_user)
@@ -48,18 +118,14 @@ def create_user(db: Session, user: schemas.UserCreate) -> models.User:
 def create_discord_user(
     db: Session, user: schemas.UserCreateDiscord
 ) -> models.User:
-    # For Discord users, create a temporary password
-    temp_password = (
-        f"discord_{user.discord_user_id}_{datetime.now().timestamp()}"
-    )
-    hashed_password = get_password_hash(temp_password)
-
+    # Discord users authenticate through the bot, so they get no password
+    # (skips a bcrypt round per registration; login rejects a null hash)
     db_user = models.User(
         email=user.email,  # Can be None for Discord users
         name=user.name,
         discord_user_id=user.discord_user_id,
         discord_username=user.discord_username,
-        hashed_password=hashed_password
+        hashed_password=None
     )
     db.add(db_user)
     db.commit()
@@ -101,46 +167,155 @@ def upsert_discord_user(
         return new_user, True, []
 
 
-def update_user(
-    db: Session, user_id: int, user_update: schemas.UserUpdate
-) -> Optional[models.User]:
-    db_user = get_user(db, user_id)
-    if not db_user:
+def upsert_discord_users_bulk(
+    db: Session, users: List[schemas.UserCreateDiscord]
+) -> Optional[List[models.User]]:
+    """Create or update many Discord users in one INSERT ... ON CONFLICT
+
+    A Discord id repeated in the batch is upserted once, with its last
+    entry. Returns None, with nothing written, if a name or email is
+    already taken by another user.
+    """
+    # ON CONFLICT can't touch the same row twice in one statement
+    users = list({user.discord_user_id: user for user in users}.values())
+    if not users:
+        return []
+
+    dialect_insert = _INSERT_BY_DIALECT.get(db.get_bind().dialect.name)
+    if dialect_insert is None:
+        # No ON CONFLICT support: upsert user by user, committing once so a
+        # conflict still leaves nothing written
+        db_users = []
+        try:
+            for user in users:
+                db_user = get_user_by_discord_id(db, user.discord_user_id)
+                if db_user is None:
+                    db_user = models.User(
+                        discord_user_id=user.discord_user_id, hashed_password=None
+                    )
+                    db.add(db_user)
+                db_user.name = user.name
+                db_user.discord_username = user.discord_username
+                if user.email:
+                    db_user.email = user.email
+                db.flush()
+                db_users.append(db_user)
+            db.commit()
+        except IntegrityError:
+            db.rollback()
+            return None
+        return db_users
+
+    stmt = dialect_insert(models.User).values([
+        {
+            "name": user.name,
+            "discord_user_id": user.discord_user_id,
+            "discord_username": user.discord_username,
+            "email": user.email,
+            "hashed_password": None,
+        }
+        for user in users
+    ])
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[models.User.discord_user_id],
+        set_={
+            "name": stmt.excluded.name,
+            "discord_username": stmt.excluded.discord_username,
+            # Like upsert_discord_user, a missing email keeps the stored one
+            "email": func.coalesce(stmt.excluded.email, models.User.email),
+            "updated_at": datetime.now(),
+        },
+    ).returning(models.User)
+
+    try:
+        db_users = db.scalars(
+            stmt, execution_options={"populate_existing": True}
+        ).all()
+        db.commit()
+    except IntegrityError:
+        # Only discord_user_id conflicts are upserted; a taken name or email
+        # lands here
+        db.rollback()
         return None
+    return db_users
 
-    for field, value in user_update.dict(exclude_unset=True).items():
-        setattr(db_user, field, value)
 
-    db_user.updated_at = datetime.now()
+def update_user(
+    db: Session, user_id: int, user_update: schemas.UserUpdate
+) -> Optional[models.User]:
+    stmt = (
+        update(models.User)
+        .where(models.User.id == user_id)
+        .values(**user_update.model_dump(exclude_unset=True),
+                updated_at=datetime.now())
+        .returning(models.User)
+    )
+    db_user = db.scalars(
+        stmt, execution_options={"populate_existing": True}
+    ).one_or_none()
     db.commit()
-    db.refresh(db_user)
     return db_user
 
 
 # Event CRUD operations
 def get_event(db: Session, event_id: int) -> Optional[models.Event]:
-    return db.query(models.Event).filter(models.Event.id == event_id).first()
+    return db.get(models.Event, event_id)
 
 
-def get_events(
+def list_events_json(
     db: Session, skip: int = 0, limit: int = 100, active_only: bool = True
-) -> List[models.Event]:
-    query = db.query(models.Event)
-    if active_only:
-        query = query.filter(models.Event.is_active.is_(True))
-    return query.offset(skip).limit(limit).all()
-
-
-def get_active_events(db: Session) -> List[models.Event]:
-    """Get all currently active events"""
-    now = datetime.now()
-    return (
-        db.query(models.Event)
-        .filter(models.Event.is_active.is_(True))
-        .filter(models.Event.start_time <= now)
-        .filter(models.Event.end_time >= now)
-        .all()
-    )
+) -> bytes:
+    """A page of events as an encoded JSON list of schemas.Event, cached per page
+
+    Built from plain column rows (no ORM objects) and serialized once when the
+    page is loaded, so cache hits hand back the same bytes with no per-request
+    encoding. Event writes clear the cache like every other listing.
+    """
+    key = ("events", skip, limit, active_only)
+    body = _event_listings_cache.get(key)
+    if body is None:
+        stmt = select(models.Event.__table__)
+        if active_only:
+            stmt = stmt.where(models.Event.is_active.is_(True))
+        body = schemas.list_adapter(schemas.Event).dump_json([
+            schemas.construct_from_orm(schemas.Event, row)
+            for row in db.execute(stmt.offset(skip).limit(limit))
+        ])
+        _event_listings_cache.set(key, body)
+    return body
+
+
+def get_active_events(db: Session) -> List[schemas.Event]:
+    """Get all currently active events
+
+    Events that are running or about to start are cached process-wide for a
+    few seconds and re-filtered against the current time on every call, so
+    the bot's polling hits the database at most once per TTL. Event writes
+    clear the cache.
+    """
+    now = _now(db)
+    candidates = _active_events_cache.get("candidates")
+    if candidates is None:
+        horizon = now + timedelta(seconds=_active_events_cache.ttl)
+        # (start, end, event) with the bounds normalized once for the
+        # per-call filter below
+        candidates = [
+            (_local_naive(db_event.start_time), _local_naive(db_event.end_time),
+             schemas.construct_from_orm(schemas.Event, db_event))
+            for db_event in db.scalars(
+                select(models.Event)
+                .where(models.Event.is_active.is_(True))
+                .where(models.Event.end_time >= now)
+                .where(models.Event.start_time <= horizon)
+                .order_by(models.Event.end_time)
+            )
+        ]
+        _active_events_cache.set("candidates", candidates)
+
+    return [
+        event for start_time, end_time, event in candidates
+        if start_time <= now <= end_time
+    ]
 
 
 def get_single_ongoing_event(
@@ -157,28 +332,50 @@ def get_single_ongoing_event(
         return ongoing_events[0], None
 
 
-def get_upcoming_events(db: Session, limit: int = 10) -> List[models.Event]:
-    """Get upcoming events (starting in the future)"""
-    now = datetime.now()
-    return (
-        db.query(models.Event)
-        .filter(models.Event.is_active.is_(True))
-        .filter(models.Event.start_time > now)
-        .order_by(models.Event.start_time)
-        .limit(limit)
-        .all()
-    )
+def get_upcoming_events(db: Session, limit: int = 10) -> List[schemas.Event]:
+    """Get upcoming events (starting in the future)
+
+    Cached like get_active_events; events that start while cached are
+    dropped on read.
+    """
+    now = _now(db)
+    key = ("upcoming", limit)
+    events = _event_listings_cache.get(key)
+    if events is None:
+        # (start, event), see get_active_events
+        events = [
+            (_local_naive(db_event.start_time),
+             schemas.construct_from_orm(schemas.Event, db_event))
+            for db_event in db.scalars(
+                select(models.Event)
+                .where(models.Event.is_active.is_(True))
+                .where(models.Event.start_time > now)
+                .order_by(models.Event.start_time)
+                .limit(limit)
+            )
+        ]
+        _event_listings_cache.set(key, events)
+
+    return [event for start_time, event in events if start_time > now]
 
 
 def get_events_by_discord_channel(
     db: Session, channel_id: str
-) -> List[models.Event]:
-    """Get events filtered by Discord channel (if implemented)"""
-    return (
-        db.query(models.Event)
-        .filter(models.Event.is_active.is_(True))
-        .all()
-    )
+) -> List[schemas.Event]:
+    """Get active events for a Discord channel (cached, see get_upcoming_events)"""
+    key = ("channel", channel_id)
+    events = _event_listings_cache.get(key)
+    if events is None:
+        events = [
+            schemas.construct_from_orm(schemas.Event, db_event)
+            for db_event in db.scalars(
+                select(models.Event)
+                .where(models.Event.discord_channel_id == channel_id)
+                .where(models.Event.is_active.is_(True))
+            )
+        ]
+        _event_listings_cache.set(key, events)
+    return events
 
 
 def create_event(db: Session, event: schemas.EventCreate, current_user: models.User) -> models.Event:
@@ -188,47 +385,97 @@ def create_event(db: Session, event: schemas.EventCreate, current_user: models.U
     db_event = models.Event(**event_data)
     db.add(db_event)
     db.commit()
+    clear_event_caches()
     db.refresh(db_event)
     return db_event
 
 
-def update_event(
-    db: Session, event_id: int, event_update: schemas.EventUpdate
+def create_event_as_discord_admin(
+    db: Session, event: schemas.EventCreate, discord_user_id: str
 ) -> Optional[models.Event]:
-    db_event = get_event(db, event_id)
-    if not db_event:
-        return None
+    """Create an event owned by a Discord admin in one statement
 
-    for field, value in event_update.dict(exclude_unset=True).items():
-        setattr(db_event, field, value)
-
-    db_event.updated_at = datetime.now()
+    INSERT ... SELECT from users filtered on the Discord id and is_admin, so
+    the admin check and the insert are atomic. Returns None (nothing
+    inserted) if the user is unknown or not an admin.
+    """
+    event_data = event.model_dump()
+    admin_id = (
+        select(*(literal(value) for value in event_data.values()), models.User.id)
+        .where(models.User.discord_user_id == discord_user_id)
+        .where(models.User.is_admin.is_(True))
+    )
+    stmt = (
+        insert(models.Event)
+        .from_select([*event_data, "user_id"], admin_id)
+        .returning(models.Event)
+    )
+    db_event = db.scalars(stmt).one_or_none()
+    if db_event is not None:
+        # RETURNING loaded every column; keep them past the commit
+        db.expunge(db_event)
     db.commit()
-    db.refresh(db_event)
+    if db_event is not None:
+        clear_event_caches()
     return db_event
 
 
-def get_event_status(
-    db: Session, event_id: int
-) -> Optional[schemas.EventStatus]:
-    """Get event status for attendance validation"""
-    db_event = get_event(db, event_id)
-    if not db_event or not db_event.is_active:
-        return None
+def update_event(
+    db: Session, event_id: int, event_update: schemas.EventUpdate
+) -> Tuple[Optional[models.Event], Optional[str]]:
+    """Update an event, returning (event, error message)
+
+    EventUpdate only validates the time window when both ends are sent; a
+    single new end is checked here against the stored one, so the update
+    never trips the database's ck_event_time_window constraint.
+    """
+    values = event_update.model_dump(exclude_unset=True)
+    times_sent = "start_time" in values or "end_time" in values
+    if times_sent and not (values.get("start_time") and values.get("end_time")):
+        stored = db.execute(
+            select(models.Event.start_time, models.Event.end_time)
+            .where(models.Event.id == event_id)
+        ).one_or_none()
+        if stored is None:
+            return None, None
+        start_time = values.get("start_time", stored.start_time)
+        end_time = values.get("end_time", stored.end_time)
+        if start_time is None or end_time is None:
+            return None, "start_time and end_time cannot be null"
+        # Either side may be aware (client input, PostgreSQL) or naive
+        if _local_naive(end_time) <= _local_naive(start_time):
+            return None, "end_time must be after start_time"
+
+    stmt = (
+        update(models.Event)
+        .where(models.Event.id == event_id)
+        .values(**values, updated_at=datetime.now())
+        .returning(models.Event)
+    )
+    db_event = db.scalars(
+        stmt, execution_options={"populate_existing": True}
+    ).one_or_none()
+    db.commit()
+    clear_event_caches()
+    return db_event, None
 
-    now = datetime.now()
 
-    if now < db_event.start_time:
+def _compute_event_status(
+    db_event: Union[models.Event, schemas.Event], now: datetime
+) -> schemas.EventStatus:
+    """Build the status of an already-loaded event at the given time"""
+    if now < _local_naive(db_event.start_time):
         status = "Event has not started yet"
         can_attend = False
-    elif now > db_event.end_time:
+    elif now > _local_naive(db_event.end_time):
         status = "Event has ended"
         can_attend = False
     else:
         status = "Event is currently active"
         can_attend = True
 
-    return schemas.EventStatus(
+    # Every value comes from a loaded event and the clock: skip validation
+    return schemas.EventStatus.model_construct(
         event_id=db_event.id,
         title=db_event.title,
         status=status,
@@ -239,114 +486,295 @@ def get_event_status(
     )
 
 
+def get_event_status(
+    db: Session, event_id: int
+) -> Optional[schemas.EventStatus]:
+    """Get event status for attendance validation
+
+    The event itself is cached for a few seconds, like get_active_events;
+    the status is computed against the current time on every call.
+    """
+    event = _event_snapshot_cache.get(event_id)
+    if event is None:
+        db_event = get_event(db, event_id)
+        if not db_event:
+            return None
+        event = schemas.construct_from_orm(schemas.Event, db_event)
+        _event_snapshot_cache.set(event_id, event)
+
+    if not event.is_active:
+        return None
+    return _compute_event_status(event, _now(db))
+
+
+def get_discord_event_statuses(
+    db: Session, discord_user_id: str, event_ids: List[int]
+) -> List[schemas.DiscordEventStatus]:
+    """Status of several active events plus the user's attendance, in one query
+
+    Missing or inactive events are left out; an unknown Discord id simply
+    has attended=False everywhere.
+    """
+    if not event_ids:
+        return []
+    attendance = models.user_event_attendance
+    attended = (
+        exists()
+        .where(attendance.c.event_id == models.Event.id)
+        .where(attendance.c.user_id == models.User.id)
+        .where(models.User.discord_user_id == discord_user_id)
+        .label("attended")
+    )
+    rows = db.execute(
+        select(
+            models.Event.id,
+            models.Event.title,
+            models.Event.start_time,
+            models.Event.end_time,
+            attended,
+        )
+        .where(models.Event.id.in_(event_ids))
+        .where(models.Event.is_active.is_(True))
+        .order_by(models.Event.start_time)
+    )
+    now = _now(db)
+    return [
+        schemas.DiscordEventStatus.model_construct(
+            **dict(_compute_event_status(row, now)), attended=row.attended
+        )
+        for row in rows
+    ]
+
+
 # Attendance CRUD operations
+def user_has_attended(db: Session, user_id: int, event_id: int) -> bool:
+    """Check attendance with a single EXISTS probe on the association table"""
+    attendance = models.user_event_attendance
+    return db.execute(
+        select(
+            exists()
+            .where(attendance.c.user_id == user_id)
+            .where(attendance.c.event_id == event_id)
+        )
+    ).scalar_one()
+
+
+def add_attendance(db: Session, user_id: int, event_id: int) -> bool:
+    """Insert an attendance row, returning False if it already existed"""
+    attendance = models.user_event_attendance
+    dialect_insert = _INSERT_BY_DIALECT.get(db.get_bind().dialect.name)
+    if dialect_insert is None:
+        # No ON CONFLICT support: fall back to check-then-insert
+        if user_has_attended(db, user_id, event_id):
+            return False
+        db.execute(insert(attendance).values(user_id=user_id, event_id=event_id))
+        return True
+
+    stmt = (
+        dialect_insert(attendance)
+        .values(user_id=user_id, event_id=event_id)
+        .on_conflict_do_nothing()
+    )
+    return db.execute(stmt).rowcount > 0
+
+
 def can_attend_event(
-    db: Session, event_id: int
+    db_event: Optional[models.Event], now: datetime
 ) -> Tuple[bool, Optional[str]]:
-    """Check if an event can be attended right now"""
-    event_status = get_event_status(db, event_id)
-    if not event_status:
+    """Check if an already-loaded event can be attended right now"""
+    if not db_event or not db_event.is_active:
         return False, "Event not found or inactive"
 
+    event_status = _compute_event_status(db_event, now)
     if not event_status.can_attend:
         return False, event_status.status
 
     return True, None
 
 
+def _record_attendance(
+    db: Session, db_user: models.User, db_event: models.Event
+) -> Optional[str]:
+    """Record attendance for a validated user/event, returning an error message"""
+    if not add_attendance(db, db_user.id, db_event.id):
+        return "Already marked as attended"
+
+    db.commit()
+    db.refresh(db_event)
+    return None
+
+
 def mark_attendance(
     db: Session, user_id: int, event_id: int
 ) -> Tuple[Optional[models.Event], Optional[str]]:
     """Mark attendance for an event with time validation"""
-    # Check if event can be attended
-    can_attend, error_msg = can_attend_event(db, event_id)
-    if not can_attend:
-        return None, error_msg
-
-    db_user = get_user(db, user_id)
     db_event = get_event(db, event_id)
 
-    if not db_user or not db_event:
-        return None, "User or event not found"
-
-    # Check if already attended
-    if db_event in db_user.attended_events:
-        return db_event, "Already marked as attended"
-
-    db_user.attended_events.append(db_event)
-    db.commit()
-    db.refresh(db_event)
-    return db_event, None
-
-
-def mark_attendance_discord(
-    db: Session, discord_user_id: str, event_id: int
-) -> Tuple[Optional[models.Event], Optional[str], Optional[models.User]]:
-    """Mark attendance for a Discord user"""
     # Check if event can be attended
-    can_attend, error_msg = can_attend_event(db, event_id)
+    can_attend, error_msg = can_attend_event(db_event, _now(db))
     if not can_attend:
-        return None, error_msg, None
+        return None, error_msg
 
-    db_user = get_user_by_discord_id(db, discord_user_id)
+    db_user = get_user(db, user_id)
     if not db_user:
-        return None, "Discord user not registered", None
-
-    db_event = get_event(db, event_id)
-    if not db_event:
-        return None, "Event not found", db_user
-
-    # Check if already attended
-    if db_event in db_user.attended_events:
-        return db_event, "Already marked as attended", db_user
+        return None, "User or event not found"
 
-    db_user.attended_events.append(db_event)
-    db.commit()
-    db.refresh(db_event)
-    return db_event, None, db_user
+    return db_event, _record_attendance(db, db_user, db_event)
 
 
 def get_user_attended_events(
     db: Session, user_id: int
 ) -> List[models.Event]:
-    db_user = get_user(db, user_id)
-    if not db_user:
-        return []
-    return db_user.attended_events
+    """Events a user attended, in one join on the association table"""
+    attendance = models.user_event_attendance
+    return db.scalars(
+        select(models.Event)
+        .join(attendance, attendance.c.event_id == models.Event.id)
+        .where(attendance.c.user_id == user_id)
+    ).all()
+
+
+def iter_event_attendees(
+    db: Session, event_id: int, batch_size: int = 500
+) -> Iterator[Sequence[RowMapping]]:
+    """Attendees of an event with the schemas.User columns, in batches
+
+    Rows are fetched `batch_size` at a time (a server-side cursor where the
+    driver supports it), so large events are never materialized at once.
+    """
+    attendance = models.user_event_attendance
+    result = db.execute(
+        select(*(getattr(models.User, name) for name in schemas.User.model_fields))
+        .join(attendance, attendance.c.user_id == models.User.id)
+        .where(attendance.c.event_id == event_id)
+        .execution_options(yield_per=batch_size)
+    )
+    return result.mappings().partitions()
 
 
-def get_event_attendees(db: Session, event_id: int) -> List[models.User]:
-    db_event = get_event(db, event_id)
-    if not db_event:
-        return []
-    return db_event.attendees
+def attend_event_atomic(
+    db: Session, discord_user_id: str, event_id: int
+) -> Tuple[Optional[models.User], Optional[models.Event],
+           Optional[schemas.EventStatus], bool]:
+    """Validate and record a Discord user's attendance in as few round trips as possible
+
+    The user and the event come back from one query (the event is outer-joined
+    so a missing event still returns the user), the time window is checked in
+    Python and the insert is ON CONFLICT DO NOTHING. Returns
+    (user, event, event_status, inserted); user is None if the Discord id is
+    unknown and event/event_status are None if the event is missing or inactive.
+    """
+    row = db.execute(
+        select(models.User, models.Event)
+        .join_from(
+            models.User,
+            models.Event,
+            (models.Event.id == event_id) & models.Event.is_active.is_(True),
+            isouter=True,
+        )
+        .where(models.User.discord_user_id == discord_user_id)
+    ).one_or_none()
+    if row is None:
+        return None, None, None, False
+
+    db_user, db_event = row
+    if db_event is None:
+        return db_user, None, None, False
+
+    event_status = _compute_event_status(db_event, _now(db))
+    if not event_status.can_attend:
+        return db_user, db_event, event_status, False
+
+    inserted = add_attendance(db, db_user.id, db_event.id)
+    if inserted:
+        # Detach the loaded rows so the commit does not expire them and the
+        # caller's attribute reads need no refresh queries
+        db.expunge(db_user)
+        db.expunge(db_event)
+        db.commit()
+    return db_user, db_event, event_status, inserted
+
+
+def list_user_attended_events_lite(db: Session, user_id: int) -> List[Row]:
+    """Events a user attended as (id, title, start_time, end_time) rows"""
+    attendance = models.user_event_attendance
+    stmt = (
+        select(
+            models.Event.id,
+            models.Event.title,
+            models.Event.start_time,
+            models.Event.end_time,
+        )
+        .join(attendance, attendance.c.event_id == models.Event.id)
+        .where(attendance.c.user_id == user_id)
+    )
+    return db.execute(stmt).all()
+
+
+def list_event_attendees_lite(
+    db: Session, event_id: int, discord_only: bool = False
+) -> List[Row]:
+    """Attendees of an event as (name, discord_username, discord_user_id) rows"""
+    attendance = models.user_event_attendance
+    stmt = (
+        select(
+            models.User.name,
+            models.User.discord_username,
+            models.User.discord_user_id,
+        )
+        .join(attendance, attendance.c.user_id == models.User.id)
+        .where(attendance.c.event_id == event_id)
+    )
+    if discord_only:
+        stmt = stmt.where(models.User.discord_user_id.is_not(None))
+    return db.execute(stmt).all()
 
 
 def check_user_attendance(
     db: Session, user_id: int, event_id: int
 ) -> bool:
-    db_user = get_user(db, user_id)
-    db_event = get_event(db, event_id)
-
-    if not db_user or not db_event:
-        return False
-
-    return db_event in db_user.attended_events
+    key = ("user", user_id, event_id)
+    if _attendance_cache.get(key):
+        return True
+    attended = user_has_attended(db, user_id, event_id)
+    if attended:
+        _attendance_cache.set(key, True)
+    return attended
 
 
 def check_discord_user_attendance(
     db: Session, discord_user_id: str, event_id: int
 ) -> bool:
-    db_user = get_user_by_discord_id(db, discord_user_id)
-    db_event = get_event(db, event_id)
+    """EXISTS probe joining the Discord id to its user; unknown ids are False"""
+    key = ("discord", discord_user_id, event_id)
+    if _attendance_cache.get(key):
+        return True
+    attendance = models.user_event_attendance
+    attended = db.execute(
+        select(
+            exists()
+            .where(attendance.c.user_id == models.User.id)
+            .where(attendance.c.event_id == event_id)
+            .where(models.User.discord_user_id == discord_user_id)
+        )
+    ).scalar_one()
+    if attended:
+        _attendance_cache.set(key, True)
+    return attended
 
-    if not db_user or not db_event:
-        return False
 
-    return db_event in db_user.attended_events
+# Admin CRUD operations
+def get_admin_status(db: Session, discord_user_id: str) -> Optional[Row]:
+    """(is_admin, name, discord_username) of a Discord user, or None if unknown"""
+    return db.execute(
+        select(
+            models.User.is_admin,
+            models.User.name,
+            models.User.discord_username,
+        ).where(models.User.discord_user_id == discord_user_id)
+    ).one_or_none()
 
 
-# Admin CRUD operations
 def make_user_admin(
     db: Session, discord_user_id: str, password: str
 ) -> Tuple[Optional[models.User], bool, str]:
@@ -375,17 +803,23 @@ def make_user_admin(
 # Name management CRUD operations
 def get_user_by_name(db: Session, name: str) -> Optional[models.User]:
     """Get user by their name (case-insensitive)"""
-    return db.query(models.User).filter(models.User.name.ilike(name)).first()
+    return db.scalars(
+        select(models.User)
+        .where(func.lower(models.User.name) == name.lower())
+        .limit(1)
+    ).first()
 
 
 def check_name_available(
     db: Session, name: str, exclude_user_id: Optional[int] = None
 ) -> bool:
     """Check if name is available (case-insensitive)"""
-    query = db.query(models.User).filter(models.User.name.ilike(name))
+    stmt = select(models.User.id).where(
+        func.lower(models.User.name) == name.lower()
+    )
     if exclude_user_id:
-        query = query.filter(models.User.id != exclude_user_id)
-    return query.first() is None
+        stmt = stmt.where(models.User.id != exclude_user_id)
+    return db.execute(stmt.limit(1)).first() is None
 
 
 def set_user_name(
@@ -410,17 +844,31 @@ def set_user_name(
     return user, f"✅ Name set to '{name}' successfully!"
 
 
-def get_all_users_list(
+def list_users_lite(
     db: Session, skip: int = 0, limit: int = 100
-) -> List[models.User]:
-    """Get list of all registered users for admin purposes"""
-    return (
-        db.query(models.User)
-        .filter(models.User.is_active.is_(True))
+) -> List[Row]:
+    """List active users as lightweight rows (no ORM objects, no password hash)"""
+    stmt = (
+        select(
+            models.User.id,
+            models.User.name,
+            models.User.discord_username,
+            models.User.discord_user_id,
+            models.User.is_admin,
+        )
+        .where(models.User.is_active.is_(True))
         .offset(skip)
         .limit(limit)
-        .all()
     )
+    return db.execute(stmt).all()
+
+
+def get_users_count(db: Session, active_only: bool = True) -> int:
+    """Count users with a single SELECT COUNT(*)"""
+    stmt = select(func.count(models.User.id))
+    if active_only:
+        stmt = stmt.where(models.User.is_active.is_(True))
+    return db.execute(stmt).scalar_one()
 
 
 def mark_attendance_for_user(
@@ -467,8 +915,12 @@ def mark_attendance_for_user(
             )
         event_id = ongoing_event.id
 
-    # Get the event
-    event = get_event(db, event_id)
+    # Get the event, locking its row so concurrent admins serialize on it
+    event = db.execute(
+        select(models.Event)
+        .where(models.Event.id == event_id)
+        .with_for_update()
+    ).scalar_one_or_none()
     if not event:
         return (
             False,
@@ -479,7 +931,7 @@ def mark_attendance_for_user(
         )
 
     # Check if event can be attended (time validation)
-    can_attend, error_msg = can_attend_event(db, event_id)
+    can_attend, error_msg = can_attend_event(event, _now(db))
     if not can_attend:
         return (
             False,
@@ -489,8 +941,8 @@ def mark_attendance_for_user(
             event
         )
 
-    # Check if user already attended
-    if check_user_attendance(db, target_user.id, event_id):
+    # Mark attendance (the insert is a no-op if the user already attended)
+    if not add_attendance(db, target_user.id, event.id):
         return (
             False,
             f"{target_user.name} (@{target_user.discord_username}) already attended this event.",
@@ -499,8 +951,6 @@ def mark_attendance_for_user(
             event
         )
 
-    # Mark attendance
-    event.attendees.append(target_user)
     db.commit()
     db.refresh(event)
 
@@ -1,14 +1,68 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool, StaticPool
 
-from app.config import settings
+from app.config import get_settings
 
-engine = create_engine(
-    settings.database_url, 
-    connect_args={"check_same_thread": False}  # Only needed for SQLite
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",  # Readers no longer block the writer
+    "PRAGMA synchronous=NORMAL",  # Safe with WAL, far fewer fsyncs
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",  # 256 MiB
 )
 
+
+# Compiled-SQL cache entries per engine (SQLAlchemy's default is 500)
+QUERY_CACHE_SIZE = 1200
+
+
+def _engine_options(database_url: str) -> dict:
+    settings = get_settings()
+    url = make_url(database_url)
+    if url.get_backend_name() != "sqlite":
+        return {
+            "pool_size": settings.db_pool_size,
+            "max_overflow": settings.db_max_overflow,
+            "pool_timeout": settings.db_pool_timeout,
+            # Reuse the most recently returned connection: after a burst the
+            # surplus ones stay idle (and can be reaped by the server's idle
+            # timeout) instead of all being kept warm round-robin
+            "pool_use_lifo": True,
+            "pool_pre_ping": True,
+            "pool_recycle": 1800,
+            "query_cache_size": QUERY_CACHE_SIZE,
+        }
+
+    options = {
+        "connect_args": {"check_same_thread": False, "timeout": 30},
+        "query_cache_size": QUERY_CACHE_SIZE,
+    }
+    if url.database in (None, "", ":memory:"):
+        # Every connection to :memory: is a new database; share just one
+        options["poolclass"] = StaticPool
+    else:
+        options.update(
+            poolclass=QueuePool,
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+            pool_timeout=settings.db_pool_timeout,
+        )
+    return options
+
+
+database_url = get_settings().database_url
+engine = create_engine(database_url, **_engine_options(database_url))
+
+if engine.dialect.name == "sqlite":
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+        cursor.close()
+
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
@@ -19,4 +73,4 @@ def get_db():
     try:
         yield db
     finally:
-        db.close() 
\ No newline at end of file
+        db.close()
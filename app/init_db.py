@@ -0,0 +1,15 @@
+"""Create the database tables once, before the API workers start
+
+Usage: python -m app.init_db
+"""
+from app import models
+from app.database import engine
+
+
+def init_db() -> None:
+    with engine.begin() as connection:
+        models.Base.metadata.create_all(bind=connection)
+
+
+if __name__ == "__main__":
+    init_db()
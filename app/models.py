@@ -1,6 +1,9 @@
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String, Table
+from sqlalchemy import (
+    Boolean, CheckConstraint, Column, DateTime, ForeignKey, Index, Integer,
+    String, Table
+)
 from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
+from sqlalchemy.sql import func, text
 
 from app.database import Base
 
@@ -10,17 +13,20 @@ user_event_attendance = Table(
     Base.metadata,
     Column('user_id', Integer, ForeignKey('users.id'), primary_key=True),
     Column('event_id', Integer, ForeignKey('events.id'), primary_key=True),
-    Column('attended_at', DateTime(timezone=True), server_default=func.now())
+    Column('attended_at', DateTime(timezone=True), server_default=func.now()),
+    # The (user_id, event_id) primary key serves per-user lookups and keeps
+    # rows unique; this reverse index serves per-event attendee lookups
+    Index('ix_att_event_user', 'event_id', 'user_id')
 )
 
 
 class User(Base):
     __tablename__ = "users"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     email = Column(String, unique=True, index=True, nullable=True)
     name = Column(String, unique=True, index=True, nullable=False)  # Name serves as username
-    hashed_password = Column(String, nullable=False)
+    hashed_password = Column(String, nullable=True)  # None for Discord-only accounts
     discord_user_id = Column(String, unique=True, index=True, nullable=True)  # Discord user ID
     discord_username = Column(String, nullable=True)  # Discord username
     is_active = Column(Boolean, default=True)
@@ -32,7 +38,8 @@ class User(Base):
     attended_events = relationship(
         "Event",
         secondary=user_event_attendance,
-        back_populates="attendees"
+        back_populates="attendees",
+        lazy="raise"  # Load explicitly (selectinload) to avoid N+1 queries
     )
 
     created_events = relationship(
@@ -41,10 +48,42 @@ class User(Base):
     )
 
 
+# Case-insensitive name lookups (get_user_by_name, check_name_available)
+Index("ix_user_name_lower", func.lower(User.name))
+
+
 class Event(Base):
     __tablename__ = "events"
+    __table_args__ = (
+        # Ongoing events lookup (is_active AND end_time >= now >= start_time);
+        # leading with end_time skips the ever-growing set of past events.
+        # The time indexes are partial on PostgreSQL: only active events
+        # are ever searched by time
+        Index(
+            "ix_event_window",
+            "is_active",
+            "end_time",
+            "start_time",
+            postgresql_where=text("is_active"),
+        ),
+        # Upcoming events lookup, also serves the ORDER BY start_time
+        Index(
+            "ix_event_active_start",
+            "is_active",
+            "start_time",
+            postgresql_where=text("is_active"),
+        ),
+        # Per-channel listing; partial on PostgreSQL to keep it small
+        Index(
+            "ix_event_channel_active",
+            "discord_channel_id",
+            "is_active",
+            postgresql_where=text("is_active"),
+        ),
+        CheckConstraint("start_time < end_time", name="ck_event_time_window"),
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     title = Column(String, nullable=False)
     description = Column(String)
     start_time = Column(DateTime(timezone=True), nullable=False)  # Event start time
@@ -59,8 +98,9 @@ class Event(Base):
     attendees = relationship(
         "User",
         secondary=user_event_attendance,
-        back_populates="attended_events"
-    ) 
+        back_populates="attended_events",
+        lazy="raise"  # Load explicitly (selectinload) to avoid N+1 queries
+    )
 
     creator = relationship(
         "User", 
@@ -0,0 +1,59 @@
+from typing import Iterable, Iterator, Mapping, Sequence, Type
+
+import orjson
+from fastapi import Response
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+from app.schemas import construct_from_orm, list_adapter
+
+
+def list_response(schema: Type[BaseModel], items: Iterable) -> Response:
+    """Render trusted items (ORM rows or `schema` instances) as a JSON list
+
+    Returning a ready response skips FastAPI's response_model validation and
+    jsonable_encoder passes; keep response_model on the route for OpenAPI.
+    The list is serialized by pydantic-core in a single dump_json call.
+    """
+    return json_response(
+        list_adapter(schema).dump_json([
+            item if isinstance(item, schema) else construct_from_orm(schema, item)
+            for item in items
+        ])
+    )
+
+
+def json_response(body: bytes, status_code: int = 200) -> Response:
+    """Send an already-encoded JSON body as is"""
+    return Response(body, status_code=status_code, media_type="application/json")
+
+
+def model_response(model: BaseModel, status_code: int = 200) -> Response:
+    """Render a trusted schema instance straight to JSON bytes
+
+    Pair with model_construct/construct_from_orm: pydantic-core serializes the
+    model in one pass with no validation or jsonable_encoder round trip.
+    """
+    return json_response(model.model_dump_json(), status_code)
+
+
+def _json_array_chunks(batches: Iterable[Sequence[Mapping]]) -> Iterator[bytes]:
+    yield b"["
+    separator = b""
+    for batch in batches:
+        if batch:
+            # Strip the brackets orjson puts around each batch
+            yield separator + orjson.dumps([dict(row) for row in batch])[1:-1]
+            separator = b","
+    yield b"]"
+
+
+def streaming_list_response(batches: Iterable[Sequence[Mapping]]) -> StreamingResponse:
+    """Stream batches of trusted row mappings as one JSON list
+
+    Only one batch is held in memory at a time. The batches are consumed
+    while the response is sent, after the route's dependencies may already
+    have been torn down: read them through a session the iterator owns, not
+    the request's.
+    """
+    return StreamingResponse(_json_array_chunks(batches), media_type="application/json")
@@ -3,7 +3,7 @@ from fastapi.security import HTTPBasic, HTTPBasicCredentials
 from sqlalchemy.orm import Session
 
 from app import crud, schemas
-from app.auth import create_access_token, verify_password
+from app.auth import authenticate_user, create_user_access_token
 from app.database import get_db
 
 router = APIRouter(prefix="/auth", tags=["authentication"])
@@ -25,12 +25,12 @@ def login_user(
     db: Session = Depends(get_db)
 ):
     """Authenticate user and return access token"""
-    user = crud.get_user_by_email(db, email=credentials.username)
-    if not user or not verify_password(credentials.password, user.hashed_password):
+    user = authenticate_user(db, credentials.username, credentials.password)
+    if not user:
         raise HTTPException(
             status_code=401,
             detail="Incorrect email or password",
             headers={"WWW-Authenticate": "Basic"},
         )
-    access_token = create_access_token(data={"sub": user.email})
+    access_token = create_user_access_token(user)
     return {"access_token": access_token, "token_type": "bearer"} 
\ No newline at end of file
@@ -1,13 +1,21 @@
 from typing import List
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Body, Depends, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 
 from app import crud, schemas
 from app.database import get_db
+from app.responses import list_response, model_response
 
 router = APIRouter(prefix="/discord", tags=["discord"])
 
+_NOT_REGISTERED_MESSAGE = "Tu não tá registrado ainda! Usa `/register` primeiro."
+
+# Users per bulk registration; keeps the multi-row INSERT (5 bound values per
+# user) under SQLite's bound-variable limit
+BULK_REGISTER_LIMIT = 100
+
 
 @router.post("/users/register", response_model=schemas.DiscordRegistrationResponse)
 def register_discord_user(
@@ -25,12 +33,27 @@ def register_discord_user(
     else:
         message = f"👋 Welcome back {user.name}! Your profile is already up to date."
 
-    return schemas.DiscordRegistrationResponse(
-        user=db_user,
+    return model_response(schemas.DiscordRegistrationResponse.model_construct(
+        user=schemas.construct_from_orm(schemas.User, db_user),
         is_new_user=is_new,
         message=message,
         changes=changes if changes else None
-    )
+    ))
+
+
+@router.post("/users/register/bulk", response_model=List[schemas.User])
+def register_discord_users_bulk(
+    users: List[schemas.UserCreateDiscord] = Body(max_length=BULK_REGISTER_LIMIT),
+    db: Session = Depends(get_db)
+):
+    """Register or update a batch of Discord users in a single statement"""
+    db_users = crud.upsert_discord_users_bulk(db=db, users=users)
+    if db_users is None:
+        raise HTTPException(
+            status_code=409,
+            detail="A name or email in the batch is already taken by another user"
+        )
+    return db_users
 
 
 @router.post("/events/create", response_model=schemas.Event)
@@ -40,7 +63,11 @@ def create_event_discord(
     db: Session = Depends(get_db)
 ):
     """Create an event via Discord (requires admin status in database)"""
-    # Check if user exists and is admin
+    db_event = crud.create_event_as_discord_admin(db, event, discord_user_id)
+    if db_event:
+        return db_event
+
+    # Nothing was inserted: find out why
     user = crud.get_user_by_discord_id(db, discord_user_id)
     if not user:
         raise HTTPException(
@@ -48,15 +75,10 @@ def create_event_discord(
             detail="Discord user not registered. Please register first with /register."
         )
 
-    if not getattr(user, 'is_admin', False):
-        raise HTTPException(
-            status_code=403,
-            detail="Only admins can create events. Use /make_admin command to become admin."
-        )
-
-    # Create the event
-    db_event = crud.create_event(db=db, event=event)
-    return db_event
+    raise HTTPException(
+        status_code=403,
+        detail="Only admins can create events. Use /make_admin command to become admin."
+    )
 
 
 @router.get("/users/list")
@@ -81,19 +103,10 @@ def list_users_discord(
             detail="Only admins can list users."
         )
 
-    users = crud.get_all_users_list(db, skip=skip, limit=limit)
-    total_users = len(crud.get_users(db, skip=0, limit=1000))  # Get total count
+    users = crud.list_users_lite(db, skip=skip, limit=limit)
+    total_users = crud.get_users_count(db)
 
-    user_items = [
-        schemas.UserListItem(
-            id=user.id,
-            name=user.name,
-            discord_username=user.discord_username,
-            discord_user_id=user.discord_user_id,
-            is_admin=user.is_admin
-        )
-        for user in users
-    ]
+    user_items = [schemas.UserListItem(**user._mapping) for user in users]
 
     return schemas.UserListResponse(
         users=user_items,
@@ -116,13 +129,14 @@ def get_discord_user(
 @router.get("/events/active", response_model=List[schemas.Event])
 def get_active_events_for_discord(db: Session = Depends(get_db)):
     """Get all currently active events that can be attended"""
-    return crud.get_active_events(db)
+    return list_response(schemas.Event, crud.get_active_events(db))
 
 
 @router.get("/events/upcoming", response_model=List[schemas.Event])
 def get_upcoming_events_for_discord(db: Session = Depends(get_db)):
     """Get upcoming events for announcements"""
-    return crud.get_upcoming_events(db, limit=5)  # Limit to next 5 events
+    # Limit to next 5 events
+    return list_response(schemas.Event, crud.get_upcoming_events(db, limit=5))
 
 
 @router.get("/events/channel/{channel_id}", response_model=List[schemas.Event])
@@ -131,7 +145,30 @@ def get_channel_events(
     db: Session = Depends(get_db)
 ):
     """Get events for a specific Discord channel"""
-    return crud.get_events_by_discord_channel(db, channel_id)
+    return list_response(
+        schemas.Event, crud.get_events_by_discord_channel(db, channel_id)
+    )
+
+
+def _attendance_success(message: str, event, user) -> ORJSONResponse:
+    """Response for a newly recorded attendance
+
+    Returned as a ready Response so the hot attend paths skip FastAPI's
+    jsonable_encoder; orjson encodes the datetime itself.
+    """
+    return ORJSONResponse({
+        "success": True,
+        "message": message,
+        "event": {
+            "id": event.id,
+            "title": event.title,
+            "end_time": event.end_time
+        },
+        "user": {
+            "name": user.name,
+            "discord_username": user.discord_username
+        }
+    })
 
 
 @router.post("/attend/auto")
@@ -140,58 +177,57 @@ def auto_attend_event_discord(
     db: Session = Depends(get_db)
 ):
     """Automatically attend the single ongoing event"""
-    # First ensure user exists
-    user = crud.get_user_by_discord_id(db, discord_user_id)
-    if not user:
-        return {
-            "success": False,
-            "message": "Tu não tá registrado ainda! Usa `/register` primeiro."
-        }
-
-    # Get the single ongoing event
+    # The ongoing event usually comes from the active-events cache
     ongoing_event, error_msg = crud.get_single_ongoing_event(db)
 
     if error_msg or not ongoing_event:
+        if not crud.get_user_by_discord_id(db, discord_user_id):
+            return {
+                "success": False,
+                "message": _NOT_REGISTERED_MESSAGE
+            }
         return {
             "success": False,
             "message": error_msg or "Nenhum evento rolando agora, parça!"
         }
 
-    # Mark attendance for the ongoing event
-    db_event, error_msg, db_user = crud.mark_attendance_discord(
+    # Validates the user and the event window and records the attendance
+    db_user, db_event, event_status, inserted = crud.attend_event_atomic(
         db, discord_user_id, ongoing_event.id
     )
+    if not db_user:
+        return {
+            "success": False,
+            "message": _NOT_REGISTERED_MESSAGE
+        }
 
-    if error_msg:
-        if error_msg == "Already marked as attended":
+    if not event_status:
+        return {
+            "success": False,
+            "message": "Nenhum evento rolando agora, parça!"
+        }
+
+    if not inserted:
+        if event_status.can_attend:
             return {
                 "success": True,
-                "message": f"Tu já bateu ponto no '{ongoing_event.title}'! "
+                "message": f"Tu já bateu ponto no '{db_event.title}'! "
                            f"Agora é só curtir o rolê! 😎",
                 "event": {
-                    "id": ongoing_event.id,
-                    "title": ongoing_event.title
+                    "id": db_event.id,
+                    "title": db_event.title
                 }
             }
-        else:
-            return {
-                "success": False,
-                "message": error_msg
-            }
-
-    return {
-        "success": True,
-        "message": f"🎉 Ponto batido no '{ongoing_event.title}'! Bora curtir o rolê! 😎",
-        "event": {
-            "id": ongoing_event.id,
-            "title": ongoing_event.title,
-            "end_time": ongoing_event.end_time.isoformat()
-        },
-        "user": {
-            "name": db_user.name,
-            "discord_username": db_user.discord_username
+        return {
+            "success": False,
+            "message": event_status.status
         }
-    }
+
+    return _attendance_success(
+        f"🎉 Ponto batido no '{db_event.title}'! Bora curtir o rolê! 😎",
+        db_event,
+        db_user
+    )
 
 
 @router.post("/attend/{event_id}")
@@ -201,62 +237,34 @@ def attend_event_discord(
     db: Session = Depends(get_db)
 ):
     """Attend an event via Discord"""
-    # First ensure user exists
-    user = crud.get_user_by_discord_id(db, discord_user_id)
-    if not user:
+    db_user, db_event, event_status, inserted = crud.attend_event_atomic(
+        db, discord_user_id, event_id
+    )
+    if not db_user:
         raise HTTPException(
             status_code=404,
             detail="Discord user not registered. Please register first."
         )
 
-    # Check event status
-    event_status = crud.get_event_status(db, event_id)
     if not event_status:
         raise HTTPException(status_code=404, detail="Event not found")
 
-    if not event_status.can_attend:
-        return {
-            "success": False,
-            "message": f"Cannot attend: {event_status.status}",
-            "event_status": event_status.dict()
-        }
-
-    # Mark attendance
-    db_event, error_msg, db_user = crud.mark_attendance_discord(db, discord_user_id, event_id)
-
-    if error_msg:
+    if not inserted:
         return {
             "success": False,
-            "message": error_msg,
-            "event_status": event_status.dict()
-        }
-
-    if error_msg == "Already marked as attended":
-        return {
-            "success": True,
-            "message": "You have already been marked as attended for this event",
-            "event": {
-                "id": db_event.id,
-                "title": db_event.title
-            }
+            "message": (
+                "Already marked as attended" if event_status.can_attend
+                else f"Cannot attend: {event_status.status}"
+            ),
+            "event_status": event_status.model_dump()
         }
 
-    return {
-        "success": True,
-        "message": f"Successfully attended '{db_event.title}'!",
-        "event": {
-            "id": db_event.id,
-            "title": db_event.title,
-            "end_time": db_event.end_time.isoformat()
-        },
-        "user": {
-            "name": db_user.name,
-            "discord_username": db_user.discord_username
-        }
-    }
+    return _attendance_success(
+        f"Successfully attended '{db_event.title}'!", db_event, db_user
+    )
 
 
-@router.get("/attendance/{discord_user_id}")
+@router.get("/attendance/{discord_user_id}", response_model=schemas.UserAttendanceResponse)
 def get_user_attendance(
     discord_user_id: str,
     db: Session = Depends(get_db)
@@ -266,25 +274,16 @@ def get_user_attendance(
     if not user:
         raise HTTPException(status_code=404, detail="Discord user not found")
 
-    attended_events = crud.get_user_attended_events(db, user.id)
+    attended_events = crud.list_user_attended_events_lite(db, user.id)
 
-    return {
-        "user": {
-            "discord_user_id": user.discord_user_id,
-            "discord_username": user.discord_username,
-            "name": user.name
-        },
-        "attended_events": [
-            {
-                "id": event.id,
-                "title": event.title,
-                "start_time": event.start_time.isoformat(),
-                "end_time": event.end_time.isoformat()
-            }
-            for event in attended_events
+    # Trusted rows: built without validation, encoded by pydantic-core
+    return model_response(schemas.UserAttendanceResponse.model_construct(
+        user=schemas.construct_from_orm(schemas.DiscordUserBrief, user),
+        attended_events=[
+            schemas.construct_from_orm(schemas.EventBrief, row) for row in attended_events
         ],
-        "total_attended": len(attended_events)
-    }
+        total_attended=len(attended_events)
+    ))
 
 
 @router.get("/event/{event_id}/status", response_model=schemas.EventStatus)
@@ -299,36 +298,26 @@ def get_event_status_discord(
     return event_status
 
 
-@router.get("/event/{event_id}/attendees")
+@router.get("/event/{event_id}/attendees", response_model=schemas.EventAttendeesResponse)
 def get_event_attendees_discord(
     event_id: int,
     db: Session = Depends(get_db)
 ):
     """Get event attendees for Discord display"""
-    attendees = crud.get_event_attendees(db, event_id)
     event = crud.get_event(db, event_id)
-
     if not event:
         raise HTTPException(status_code=404, detail="Event not found")
 
-    return {
-        "event": {
-            "id": event.id,
-            "title": event.title,
-            "start_time": event.start_time.isoformat(),
-            "end_time": event.end_time.isoformat()
-        },
-        "attendees": [
-            {
-                "name": attendee.name,
-                "discord_username": attendee.discord_username,
-                "discord_user_id": attendee.discord_user_id
-            }
-            for attendee in attendees
-            if attendee.discord_user_id  # Only show Discord users
+    # Only Discord users are shown
+    attendees = crud.list_event_attendees_lite(db, event_id, discord_only=True)
+
+    return model_response(schemas.EventAttendeesResponse.model_construct(
+        event=schemas.construct_from_orm(schemas.EventBrief, event),
+        attendees=[
+            schemas.construct_from_orm(schemas.DiscordUserBrief, row) for row in attendees
         ],
-        "total_attendees": len([a for a in attendees if a.discord_user_id])
-    }
+        total_attendees=len(attendees)
+    ))
 
 
 @router.post("/admin/make-admin", response_model=schemas.AdminResponse)
@@ -362,7 +351,7 @@ def check_admin_status_discord(
     db: Session = Depends(get_db)
 ):
     """Check if a Discord user is admin"""
-    user = crud.get_user_by_discord_id(db, discord_user_id)
+    user = crud.get_admin_status(db, discord_user_id)
     if not user:
         raise HTTPException(
             status_code=404,
@@ -370,7 +359,7 @@ def check_admin_status_discord(
         )
 
     return {
-        "is_admin": getattr(user, 'is_admin', False),
+        "is_admin": user.is_admin,
         "user_name": user.name,
         "discord_username": user.discord_username
     }
@@ -1,14 +1,19 @@
-from typing import List
+from typing import Iterator, List
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 
 from app import crud, models, schemas
-from app.auth import get_current_active_user
-from app.database import get_db
+from app.auth import UserClaims, get_current_active_claims, get_current_active_user
+from app.database import SessionLocal, get_db
+from app.responses import json_response, list_response, model_response, streaming_list_response
 
 router = APIRouter(prefix="/events", tags=["events"])
 
+# Largest page of the cached listings; pages are cache keys, so clients must
+# not be able to mint arbitrarily many or arbitrarily large ones
+MAX_PAGE_SIZE = 100
+
 
 @router.post("/", response_model=schemas.Event, status_code=status.HTTP_201_CREATED)
 def create_event(
@@ -21,52 +26,53 @@ def create_event(
 
 @router.get("/", response_model=List[schemas.Event])
 def read_events(
-    skip: int = 0,
-    limit: int = 100,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(MAX_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
     active_only: bool = True,
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_active_user)
+    current_user: UserClaims = Depends(get_current_active_claims)
 ):
-    events = crud.get_events(db, skip=skip, limit=limit, active_only=active_only)
-    return events
+    return json_response(
+        crud.list_events_json(db, skip=skip, limit=limit, active_only=active_only)
+    )
 
 
 @router.get("/active", response_model=List[schemas.Event])
 def read_active_events(
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_active_user)
+    current_user: UserClaims = Depends(get_current_active_claims)
 ):
     """Get events that are currently happening (can be attended)"""
     events = crud.get_active_events(db)
-    return events
+    return list_response(schemas.Event, events)
 
 
 @router.get("/upcoming", response_model=List[schemas.Event])
 def read_upcoming_events(
-    limit: int = 10,
+    limit: int = Query(10, ge=1, le=MAX_PAGE_SIZE),
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_active_user)
+    current_user: UserClaims = Depends(get_current_active_claims)
 ):
     events = crud.get_upcoming_events(db, limit=limit)
-    return events
+    return list_response(schemas.Event, events)
 
 
 @router.get("/discord-channel/{channel_id}", response_model=List[schemas.Event])
 def read_events_by_discord_channel(
     channel_id: str,
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_active_user)
+    current_user: UserClaims = Depends(get_current_active_claims)
 ):
     """Get events for a specific Discord channel"""
     events = crud.get_events_by_discord_channel(db, channel_id)
-    return events
+    return list_response(schemas.Event, events)
 
 
 @router.get("/{event_id}", response_model=schemas.Event)
 def read_event(
     event_id: int,
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_active_user)
+    current_user: UserClaims = Depends(get_current_active_claims)
 ):
     db_event = crud.get_event(db, event_id=event_id)
     if db_event is None:
@@ -78,7 +84,7 @@ def read_event(
 def get_event_status(
     event_id: int,
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_active_user)
+    current_user: UserClaims = Depends(get_current_active_claims)
 ):
     """Get the current status of an event and whether it can be attended"""
     event_status = crud.get_event_status(db, event_id)
@@ -94,12 +100,62 @@ def update_event(
     db: Session = Depends(get_db),
     current_user: models.User = Depends(get_current_active_user)
 ):
-    updated_event = crud.update_event(db, event_id, event_update)
+    updated_event, error_msg = crud.update_event(db, event_id, event_update)
+    if error_msg:
+        raise HTTPException(status_code=422, detail=error_msg)
     if not updated_event:
         raise HTTPException(status_code=404, detail="Event not found")
     return updated_event
 
 
+def _attendance_success(db_event: models.Event, db_user: models.User):
+    return model_response(schemas.AttendanceResponse.model_construct(
+        success=True,
+        message="Attendance marked successfully",
+        event=schemas.construct_from_orm(schemas.Event, db_event),
+        user=schemas.construct_from_orm(schemas.User, db_user),
+    ))
+
+
+@router.post("/discord/attend", response_model=schemas.AttendanceResponse)
+def mark_discord_attendance(
+    attendance: schemas.AttendanceCreateDiscord,
+    db: Session = Depends(get_db)
+):
+    """Mark attendance for a Discord user (no authentication required)"""
+    db_user, db_event, event_status, inserted = crud.attend_event_atomic(
+        db, attendance.discord_user_id, attendance.event_id
+    )
+    if not db_user:
+        raise HTTPException(status_code=404, detail="Discord user not registered")
+    if not event_status:
+        raise HTTPException(status_code=404, detail="Event not found or inactive")
+
+    if not inserted:
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "error": (
+                    "Already marked as attended" if event_status.can_attend
+                    else event_status.status
+                ),
+                "event_status": event_status.model_dump(mode="json")
+            }
+        )
+
+    return _attendance_success(db_event, db_user)
+
+
+@router.post("/discord/status-batch", response_model=List[schemas.DiscordEventStatus])
+def discord_status_batch(
+    request: schemas.DiscordStatusBatchRequest,
+    db: Session = Depends(get_db)
+):
+    """Status and attendance of several events for one Discord user (no authentication required)"""
+    statuses = crud.get_discord_event_statuses(db, request.discord_user_id, request.event_ids)
+    return list_response(schemas.DiscordEventStatus, statuses)
+
+
 @router.post("/{event_id}/attend", response_model=schemas.AttendanceResponse)
 def mark_event_attendance(
     event_id: int,
@@ -116,7 +172,7 @@ def mark_event_attendance(
                 status_code=400, 
                 detail={
                     "error": error_msg,
-                    "event_status": event_status.dict()
+                    "event_status": event_status.model_dump(mode="json")
                 }
             )
         else:
@@ -125,63 +181,36 @@ def mark_event_attendance(
     if not db_event:
         raise HTTPException(status_code=404, detail="Event not found")
     
-    return schemas.AttendanceResponse(
-        message="Attendance marked successfully",
-        event=db_event,
-        user=current_user,
-        attended_at=db_event.attendees[0].attended_at if db_event.attendees else None
-    )
+    return _attendance_success(db_event, current_user)
 
 
-@router.post("/discord/attend", response_model=schemas.AttendanceResponse)
-def mark_discord_attendance(
-    attendance: schemas.AttendanceCreateDiscord,
-    db: Session = Depends(get_db)
-):
-    """Mark attendance for a Discord user (no authentication required)"""
-    db_event, error_msg, db_user = crud.mark_attendance_discord(
-        db, attendance.discord_user_id, attendance.event_id
-    )
-    
-    if error_msg:
-        event_status = crud.get_event_status(db, attendance.event_id)
-        if event_status:
-            raise HTTPException(
-                status_code=400,
-                detail={
-                    "error": error_msg,
-                    "event_status": event_status.dict()
-                }
-            )
-        else:
-            raise HTTPException(status_code=404, detail=error_msg)
-    
-    if not db_event or not db_user:
-        raise HTTPException(status_code=404, detail="Event or user not found")
-    
-    return schemas.AttendanceResponse(
-        message="Attendance marked successfully",
-        event=db_event,
-        user=db_user,
-        attended_at=db_event.attendees[0].attended_at if db_event.attendees else None
-    )
+def _stream_event_attendees(bind, event_id: int) -> Iterator:
+    """Attendee batches read through a session owned by the stream itself
+
+    The request's session may be closed before the body is sent, so the
+    stream opens its own on the same engine and closes it when done.
+    """
+    db = SessionLocal(bind=bind)
+    try:
+        yield from crud.iter_event_attendees(db, event_id)
+    finally:
+        db.close()
 
 
 @router.get("/{event_id}/attendees", response_model=List[schemas.User])
 def read_event_attendees(
     event_id: int,
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_active_user)
+    current_user: UserClaims = Depends(get_current_active_claims)
 ):
-    attendees = crud.get_event_attendees(db, event_id)
-    return attendees
+    return streaming_list_response(_stream_event_attendees(db.get_bind(), event_id))
 
 
 @router.get("/{event_id}/check-attendance")
 def check_attendance(
     event_id: int,
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_active_user)
+    current_user: UserClaims = Depends(get_current_active_claims)
 ):
     attended = crud.check_user_attendance(db, current_user.id, event_id)
     return {"attended": attended, "user_id": current_user.id, "event_id": event_id}
@@ -4,8 +4,9 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
 from app import crud, models, schemas
-from app.auth import get_current_active_user
+from app.auth import UserClaims, get_current_active_claims, get_current_active_user
 from app.database import get_db
+from app.responses import list_response
 
 router = APIRouter(prefix="/users", tags=["users"])
 
@@ -29,17 +30,19 @@ def update_current_user(
 
 @router.get("/me/events", response_model=List[schemas.Event])
 def read_user_attended_events(
-    current_user: models.User = Depends(get_current_active_user),
+    current_user: UserClaims = Depends(get_current_active_claims),
     db: Session = Depends(get_db)
 ):
-    return crud.get_user_attended_events(db, current_user.id)
+    return list_response(
+        schemas.Event, crud.get_user_attended_events(db, current_user.id)
+    )
 
 
 @router.get("/{user_id}", response_model=schemas.User)
 def read_user(
     user_id: int,
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_active_user)
+    current_user: UserClaims = Depends(get_current_active_claims)
 ):
     db_user = crud.get_user(db, user_id=user_id)
     if db_user is None:
@@ -52,7 +55,7 @@ def read_users(
     skip: int = 0,
     limit: int = 100,
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_active_user)
+    current_user: UserClaims = Depends(get_current_active_claims)
 ):
     users = crud.get_users(db, skip=skip, limit=limit)
-    return users 
\ No newline at end of file
+    return list_response(schemas.User, users) 
\ No newline at end of file
@@ -1,7 +1,28 @@
+import re
 from datetime import datetime
-from typing import List, Optional
+from functools import lru_cache
+from typing import List, Optional, Type, TypeVar
 
-from pydantic import BaseModel, EmailStr, validator
+from pydantic import BaseModel, EmailStr, Field, TypeAdapter, model_validator, validator
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+def construct_from_orm(schema: Type[ModelT], obj) -> ModelT:
+    """Build `schema` from a trusted ORM object, skipping validation
+
+    Database rows already satisfy the schema, so this copies the attributes
+    with model_construct instead of re-validating them with model_validate.
+    """
+    return schema.model_construct(
+        **{name: getattr(obj, name) for name in schema.model_fields}
+    )
+
+
+@lru_cache(maxsize=None)
+def list_adapter(schema: Type[BaseModel]) -> TypeAdapter:
+    """One TypeAdapter(List[schema]) per schema, built on first use"""
+    return TypeAdapter(List[schema])
 
 
 # User schemas
@@ -28,7 +49,10 @@ class UserUpdate(BaseModel):
     is_active: Optional[bool] = None
 
 
-class User(UserBase):
+class User(BaseModel):
+    # Plain str, not EmailStr: stored emails were validated on the way in
+    email: Optional[str] = None
+    name: str
     id: int
     is_active: bool
     is_admin: bool = False
@@ -48,18 +72,26 @@ class EventBase(BaseModel):
     discord_channel_id: Optional[str] = None
 
 
-class EventCreate(EventBase):
-    start_time: datetime
-    end_time: datetime
+class TimeRangeMixin(BaseModel):
+    """Checks start_time < end_time once per model, when both are given"""
 
-    @validator('end_time')
-    def end_time_must_be_after_start_time(cls, v, values):
-        if 'start_time' in values and v <= values['start_time']:
+    @model_validator(mode='after')
+    def end_time_must_be_after_start_time(self):
+        if (
+            self.start_time is not None
+            and self.end_time is not None
+            and self.end_time <= self.start_time
+        ):
             raise ValueError('end_time must be after start_time')
-        return v
+        return self
+
+
+class EventCreate(TimeRangeMixin, EventBase):
+    start_time: datetime
+    end_time: datetime
 
 
-class EventUpdate(BaseModel):
+class EventUpdate(TimeRangeMixin):
     title: Optional[str] = None
     description: Optional[str] = None
     start_time: Optional[datetime] = None
@@ -67,12 +99,6 @@ class EventUpdate(BaseModel):
     discord_channel_id: Optional[str] = None
     is_active: Optional[bool] = None
 
-    @validator('end_time')
-    def end_time_must_be_after_start_time(cls, v, values):
-        if 'start_time' in values and v <= values['start_time']:
-            raise ValueError('end_time must be after start_time')
-        return v
-
 
 class Event(EventBase):
     id: int
@@ -98,6 +124,11 @@ class EventStatus(BaseModel):
     current_time: datetime
 
 
+class DiscordEventStatus(EventStatus):
+    """Event status plus whether a given Discord user already attended"""
+    attended: bool
+
+
 # Attendance schemas
 class AttendanceRequest(BaseModel):
     event_id: int
@@ -109,6 +140,12 @@ class AttendanceCreateDiscord(BaseModel):
     event_id: int
 
 
+class DiscordStatusBatchRequest(BaseModel):
+    """Events whose status a Discord user wants in one call"""
+    discord_user_id: str
+    event_ids: List[int] = Field(max_length=100)
+
+
 class AttendanceResponse(BaseModel):
     success: bool
     message: str
@@ -116,6 +153,41 @@ class AttendanceResponse(BaseModel):
     user: Optional[User] = None
 
 
+class EventBrief(BaseModel):
+    """Event fields shown in Discord attendance listings"""
+    id: int
+    title: str
+    start_time: datetime
+    end_time: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class DiscordUserBrief(BaseModel):
+    """Discord identity shown in attendance listings"""
+    name: str
+    discord_username: Optional[str] = None
+    discord_user_id: Optional[str] = None
+
+    class Config:
+        from_attributes = True
+
+
+class UserAttendanceResponse(BaseModel):
+    """Attendance history of a Discord user"""
+    user: DiscordUserBrief
+    attended_events: List[EventBrief]
+    total_attended: int
+
+
+class EventAttendeesResponse(BaseModel):
+    """Discord attendees of an event"""
+    event: EventBrief
+    attendees: List[DiscordUserBrief]
+    total_attendees: int
+
+
 # Token schemas
 class Token(BaseModel):
     access_token: str
@@ -158,6 +230,10 @@ class AdminResponse(BaseModel):
 
 
 # Username management schemas
+_NAME_RE = re.compile(r'[a-zA-Z0-9_-]+')
+_RESERVED_NAMES = frozenset({'admin', 'root', 'system', 'bot', 'discord', 'everyone', 'here'})
+
+
 class UsernameSetRequest(BaseModel):
     """Request to set or update username"""
     name: str
@@ -177,16 +253,15 @@ class UsernameSetRequest(BaseModel):
             raise ValueError('Name must be at most 30 characters long')
 
         # Character validation (letters, numbers, underscore, hyphen)
-        import re
-        if not re.match(r'^[a-zA-Z0-9_-]+$', v):
+        if not _NAME_RE.fullmatch(v):
             raise ValueError('Name can only contain letters, numbers, underscore (_) and hyphen (-)')
 
         # Reserved names check
-        reserved_names = ['admin', 'root', 'system', 'bot', 'discord', 'everyone', 'here']
-        if v.lower() in reserved_names:
+        name = v.lower()
+        if name in _RESERVED_NAMES:
             raise ValueError(f"Name '{v}' is reserved. Please choose another one.")
 
-        return v.lower()  # Store in lowercase for consistency
+        return name  # Store in lowercase for consistency
 
 
 class UsernameSetResponse(BaseModel):
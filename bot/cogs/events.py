@@ -5,13 +5,66 @@ This module contains all event-related Discord slash commands for the
 SNFRS Event Attendance System.
 """
 
-import json
+import asyncio
 import logging
+import time
+from typing import Any, Dict, Optional, Tuple
 
 import aiohttp
 import discord
+import orjson
 from discord import app_commands
-from discord.ext import commands
+from discord.ext import commands, tasks
+
+# Event ids are positive; Discord rejects anything else client-side, so bad
+# ids never cost an API round trip
+EventId = app_commands.Range[int, 1]
+
+# Seconds the event listings may be stale; the background refresh runs a
+# bit more often so their cache entries are normally warm
+_LISTINGS_TTL = 30
+_LISTING_ENDPOINTS = ("/discord/events/active", "/discord/events/upcoming")
+
+# Seconds a user's admin status is trusted before asking the API again
+_ADMIN_TTL = 60
+
+# Users listed by /listar-usuarios; the rest are only counted
+_USER_LIST_LIMIT = 20
+
+# Fixed replies, shared by the commands below
+_NOT_REGISTERED_MSG = "❌ Ô meu, tu não tá cadastrado! Manda um `/register` primeiro! 😅"
+_ACTIVE_EVENTS_HEADER = "🔥 **ROLÊS QUE TÃO BOMBANDO:**\n"
+_ANNOUNCEMENT_HEADER = "🎉 **PRÓXIMOS ROLÊS CONFIRMADOS, GALERA!** 🎉\n\n"
+_ANNOUNCEMENT_FOOTER = (
+    "🔥 **BORA QUE VAI SER SINFOROSO DEMAIS!** 🔥\n"
+    "💥 Usa `/register` pra se cadastrar e `/bater-ponto` durante o rolê!"
+)
+# API status code -> reply, for the errors a command answers with fixed text
+_CREATE_EVENT_ERRORS = {
+    403: "❌ Só os admins sinforosos podem criar rolê! Cola no `/make_admin 123` se tu for parça! 😎",
+    404: _NOT_REGISTERED_MSG,
+}
+_ATTEND_FOR_USER_ERRORS = {
+    403: "❌ Só admin sinforoso pode marcar ponto pros outros! 😎",
+    404: _NOT_REGISTERED_MSG,
+}
+_HELP_TEXT = '''🤖 **COMANDOS DO ROLÊDEQUINTA** (powered by sinforoso lifestyle)
+
+📝 `/register [nome]` - Se cadastra no rolê e define teu nome
+🔥 `/events` - Cola os rolês que tão bombando agora  
+✅ `/bater-ponto` - Marca presença no rolê que tá rolando
+📊 `/status` - Vê quantos rolês tu já colou na vida
+🔑 `/make_admin <senha>` - Vira admin sinforoso (precisa da senha secreta)
+➕ `/create_event` - Cria um rolê novo (só pros admins sinforosos)
+📋 `/event_status <id>` - Cola como tá o rolê
+👥 `/event_attendees <id>` - Vê quem tá colando no rolê  
+👤 `/user_info` - Cola teu perfil sinforoso
+🔊 `/avisar-role` - Avisa a galera sobre os próximos rolês (só ADM)
+🔥 `/bater-ponto-para <nome>` - Marca presença pra outro parça (só ADM)
+👥 `/listar-usuarios` - Lista toda a galera cadastrada (só ADM)
+❓ `/bothelp` - Mostra essa ajuda sinforosa
+
+**Dúvida? Fala com o grupo sinforoso lifestyle! 😎🔥**'''
 
 
 class EventsCog(commands.Cog):
@@ -22,60 +75,183 @@ class EventsCog(commands.Cog):
         self.bot = bot
         self.api_base_url = bot.config.api_base_url
         self.logger = logging.getLogger(__name__)
+        # Bot-wide pooled session, owned (opened and closed) by the bot
+        self.session: aiohttp.ClientSession = bot.http_session
+        # (endpoint, params) -> (expires at, data, status) for api_get_cached
+        self._cache: Dict[Tuple, Tuple[float, Any, int]] = {}
+        # Same keys -> the GET currently in flight, shared by concurrent callers
+        self._inflight: Dict[Tuple, asyncio.Task] = {}
+        # discord user id -> (expires at, is admin) for _is_admin
+        self._admin_cache: Dict[str, Tuple[float, bool]] = {}
+        # guild id -> id of its announcement ("chat") channel
+        self._chat_channels: Dict[int, int] = {}
+
+    async def cog_load(self):
+        """Start warming the event listings cache."""
+        self._refresh_listings.start()
+
+    async def cog_unload(self):
+        """Stop the background refresh."""
+        self._refresh_listings.cancel()
+
+    async def _parse(self, resp: aiohttp.ClientResponse, url: str):
+        """Read and decode an API response body in one pass; returns (data, status)."""
+        try:
+            raw = await resp.read()
+        except Exception as e:
+            self.logger.error("Error reading response from %s: %s", url, e)
+            return {"error": f"Failed to read API response: {str(e)}"}, resp.status
+        try:
+            data = orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            self.logger.warning("Non-JSON response from %s: %r...", url, raw[:200])
+            data = {"error": f"API returned non-JSON response: {raw[:100]!r}..."}
+        return data, resp.status
+
+    async def _request(self, method: str, endpoint: str, *, json=None, params=None):
+        """Make a request to the API; returns (data, status)."""
+        url = f"{self.api_base_url}{endpoint}"
+        debug = self.logger.isEnabledFor(logging.DEBUG)  # Checked once per call
+        if debug:
+            self.logger.debug("📤 %s %s - Data: %s - Params: %s", method, url, json, params)
+        async with self.session.request(method, url, json=json, params=params) as resp:
+            data, status = await self._parse(resp, url)
+        if debug:
+            self.logger.debug("📥 %s %s - Status: %s - Response: %s", method, url, status, data)
+        return data, status
 
     async def api_post(self, endpoint: str, json=None, params=None):
         """Make a POST request to the API."""
-        url = f"{self.api_base_url}{endpoint}"
-        self.logger.debug(f"📤 POST {url} - Data: {json} - Params: {params}")
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, json=json, params=params) as resp:
-                try:
-                    # Check content type first
-                    content_type = resp.headers.get('content-type', '')
-                    if 'application/json' in content_type:
-                        data = await resp.json()
-                    else:
-                        # If not JSON, get text and try to parse it
-                        text_data = await resp.text()
-                        self.logger.warning(f"Non-JSON response from {url}: {text_data[:200]}...")
-                        try:
-                            data = json.loads(text_data)
-                        except json.JSONDecodeError:
-                            # If we can't parse as JSON, return the text as an error
-                            data = {"error": f"API returned non-JSON response: {text_data[:100]}..."}
-
-                    self.logger.debug(f"📥 POST {url} - Status: {resp.status} - Response: {data}")
-                    return data, resp.status
-                except Exception as e:
-                    self.logger.error(f"Error parsing response from {url}: {e}")
-                    return {"error": f"Failed to parse API response: {str(e)}"}, resp.status
+        return await self._request("POST", endpoint, json=json, params=params)
 
     async def api_get(self, endpoint: str, params=None):
         """Make a GET request to the API."""
-        url = f"{self.api_base_url}{endpoint}"
-        self.logger.debug(f"📤 GET {url} - Params: {params}")
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params) as resp:
-                try:
-                    # Check content type first
-                    content_type = resp.headers.get('content-type', '')
-                    if 'application/json' in content_type:
-                        data = await resp.json()
-                    else:
-                        # If not JSON, get text and try to parse it
-                        text_data = await resp.text()
-                        self.logger.warning(f"Non-JSON response from {url}: {text_data[:200]}...")
-                        try:
-                            data = json.loads(text_data)
-                        except json.JSONDecodeError:
-                            # If we can't parse as JSON, return the text as an error
-                            data = {"error": f"API returned non-JSON response: {text_data[:100]}..."}
-
-                    self.logger.debug(f"📥 GET {url} - Status: {resp.status} - Response: {data}")
-                    return data, resp.status
-                except Exception as e:
-                    self.logger.error(f"Error parsing response from {url}: {e}")
-                    return {"error": f"Failed to parse API response: {str(e)}"}, resp.status
+        return await self._request("GET", endpoint, params=params)
+
+    def _cached(self, key: Tuple):
+        """The fresh cache entry for key as (data, status), or None."""
+        cached = self._cache.get(key)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1], cached[2]
+        return None
+
+    async def api_get_cached(
+        self, endpoint: str, params=None, ttl: float = 30,
+        interaction: Optional[discord.Interaction] = None, refresh: bool = False
+    ):
+        """GET through a short-lived in-memory cache; only 200 responses are kept.
+
+        Concurrent calls for the same GET share one request. With ttl=0 the
+        result is not cached and only that sharing applies. If an interaction
+        is given and the API has to be called, the interaction is deferred
+        first so a slow API can't run past Discord's 3s reply window; reply
+        with self._reply then. refresh=True skips the cache lookup and
+        replaces the entry.
+        """
+        key = (endpoint, tuple(sorted((params or {}).items())))
+        cached = None if refresh else self._cached(key)
+        if cached is not None:
+            return cached
+        if interaction is not None and not interaction.response.is_done():
+            await interaction.response.defer(ephemeral=True, thinking=True)
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self.api_get(endpoint, params=params))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shielded so one cancelled command doesn't cancel the others' request
+        data, status_code = await asyncio.shield(task)
+
+        now = time.monotonic()
+        if status_code == 200 and ttl > 0:
+            if len(self._cache) >= 256:
+                self._cache = {k: v for k, v in self._cache.items() if v[0] > now}
+            self._cache[key] = (now + ttl, data, status_code)
+        return data, status_code
+
+    async def bulk_get(self, endpoints, **kwargs):
+        """api_get_cached several endpoints concurrently over the shared pool.
+
+        Results come back in the order of endpoints; a request that raised
+        is returned as its exception so one failure doesn't discard the rest.
+        """
+        return await asyncio.gather(
+            *(self.api_get_cached(endpoint, **kwargs) for endpoint in endpoints),
+            return_exceptions=True
+        )
+
+    @tasks.loop(seconds=_LISTINGS_TTL - 5)
+    async def _refresh_listings(self):
+        """Re-fetch the event listings so commands rarely wait on the API."""
+        results = await self.bulk_get(_LISTING_ENDPOINTS, ttl=_LISTINGS_TTL, refresh=True)
+        for endpoint, result in zip(_LISTING_ENDPOINTS, results):
+            if isinstance(result, Exception):
+                # Keep the loop alive; the next tick (or a command) retries
+                self.logger.warning("Refreshing %s failed: %s", endpoint, result)
+
+    async def _is_admin(self, discord_user_id: str) -> Optional[bool]:
+        """Whether the user is an admin, or None if the check failed.
+
+        Answers are cached for _ADMIN_TTL seconds; failures are not cached.
+        """
+        cached = self._admin_cache.get(discord_user_id)
+        now = time.monotonic()
+        if cached is not None and cached[0] > now:
+            return cached[1]
+
+        data, status = await self.api_post(
+            "/discord/admin/check-admin", params={"discord_user_id": discord_user_id}
+        )
+        if status != 200:
+            return None
+        is_admin = bool(data.get("is_admin", False))
+        if len(self._admin_cache) >= 256:
+            self._admin_cache = {k: v for k, v in self._admin_cache.items() if v[0] > now}
+        self._admin_cache[discord_user_id] = (now + _ADMIN_TTL, is_admin)
+        return is_admin
+
+    def _find_chat_channel(self, guild: Optional[discord.Guild]):
+        """The guild's first text channel with 'chat' in its name, or None.
+
+        The channel found is remembered per guild and re-checked on use, so
+        renamed or deleted channels trigger a fresh scan.
+        """
+        if guild is None:
+            return None
+        channel_id = self._chat_channels.get(guild.id)
+        if channel_id is not None:
+            channel = guild.get_channel(channel_id)
+            if channel is not None and 'chat' in channel.name.lower():
+                return channel
+            del self._chat_channels[guild.id]
+
+        for channel in guild.text_channels:
+            if 'chat' in channel.name.lower():
+                self._chat_channels[guild.id] = channel.id
+                return channel
+        return None
+
+    async def _notify_chat(self, guild: Optional[discord.Guild], content: str):
+        """Post content to the guild's chat channel, if any; failures are ignored."""
+        try:
+            chat_channel = self._find_chat_channel(guild)
+            if chat_channel:
+                await chat_channel.send(content)
+        except Exception:
+            pass  # Ignore notification errors
+
+    def _invalidate(self, prefix: str = ""):
+        """Drop cached GETs whose endpoint starts with prefix (all by default)."""
+        for key in [k for k in self._cache if k[0].startswith(prefix)]:
+            del self._cache[key]
+
+    async def _reply(self, interaction: discord.Interaction, content: str):
+        """Send an ephemeral reply, as a followup if the interaction was deferred."""
+        if interaction.response.is_done():
+            await interaction.followup.send(content, ephemeral=True)
+        else:
+            await interaction.response.send_message(content, ephemeral=True)
 
     @app_commands.command(name="register", description="Se cadastra no rolê e define teu nome")
     async def slash_register(self, interaction: discord.Interaction, nome: str = None):
@@ -89,6 +265,7 @@ class EventsCog(commands.Cog):
         })
 
         if status_code == 200:
+            self._invalidate("/discord/event/")  # Attendee names may have changed
             message = data.get("message", f"Tá ligado! Agora tu é o **{user_name}** no rolê")
             await interaction.response.send_message(f"✅ {message} 🎉", ephemeral=True)
         else:
@@ -99,30 +276,34 @@ class EventsCog(commands.Cog):
     @app_commands.command(name="events", description="Cola os rolês que tão bombando agora")
     async def slash_events(self, interaction: discord.Interaction):
         """Show currently active events."""
-        data, _ = await self.api_get("/discord/events/active")
+        data, _ = await self.api_get_cached(
+            "/discord/events/active", ttl=_LISTINGS_TTL, interaction=interaction
+        )
 
         if not data:
-            await interaction.response.send_message(
-                "🤷‍♂️ Ó mano, não tem rolê bombando agora não. Volta aqui depois!", ephemeral=True
+            await self._reply(
+                interaction, "🤷‍♂️ Ó mano, não tem rolê bombando agora não. Volta aqui depois!"
             )
             return
 
-        events_text = "🔥 **ROLÊS QUE TÃO BOMBANDO:**\n"
-        for event in data:
-            events_text += f"• **{event['title']}** (ID: {event['id']})\n"
-            events_text += f"  📝 {event.get('description', 'Vai ser sinforoso, confia!')}\n"
-            events_text += f"  ⏰ Até: {event['end_time']}\n\n"
+        events_text = _ACTIVE_EVENTS_HEADER + "".join(
+            f"• **{event['title']}** (ID: {event['id']})\n"
+            f"  📝 {event.get('description', 'Vai ser sinforoso, confia!')}\n"
+            f"  ⏰ Até: {event['end_time']}\n\n"
+            for event in data
+        )
 
-        await interaction.response.send_message(events_text, ephemeral=True)
+        await self._reply(interaction, events_text)
 
     @app_commands.command(name="bater-ponto", description="Marca presença no rolê que tá rolando")
     async def slash_bater_ponto(self, interaction: discord.Interaction):
         """Mark attendance for the current event."""
         response_data, status_code = await self.api_post(
-            f"/discord/attend/auto?discord_user_id={interaction.user.id}"
+            "/discord/attend/auto", params={"discord_user_id": str(interaction.user.id)}
         )
 
         if status_code == 200 and response_data.get("success"):
+            self._invalidate("/discord/event/")
             await interaction.response.send_message(
                 f"✅ {response_data['message']} 🎊", ephemeral=True
             )
@@ -138,26 +319,33 @@ class EventsCog(commands.Cog):
     @app_commands.command(name="status", description="Vê quantos rolês tu já colou na vida")
     async def slash_status(self, interaction: discord.Interaction):
         """Check your attendance status."""
-        data, status_code = await self.api_get(f"/discord/attendance/{interaction.user.id}")
+        # Independent GETs: overlap them instead of paying two round trips
+        (data, status_code), (active_events, active_status) = await asyncio.gather(
+            self.api_get_cached(f"/discord/attendance/{interaction.user.id}", ttl=0),
+            self.api_get_cached("/discord/events/active", ttl=_LISTINGS_TTL),
+        )
 
-        if status_code == 200:
-            total = data['total_attended']
-            if total == 0:
-                await interaction.response.send_message(
-                    "📊 Rapaz, tu ainda não colou em nenhum rolê! Bora quebrar esse jejum! 😜", ephemeral=True
-                )
-            elif total == 1:
-                await interaction.response.send_message(
-                    "📊 Tu colou em 1 rolê! Tá começando a pegar o jeito! 🚀", ephemeral=True
-                )
-            else:
-                await interaction.response.send_message(
-                    f"📊 Ó o sinforoso! Tu já colou em {total} rolês! Tá viciado mesmo! 🔥🎉", ephemeral=True
-                )
-        else:
+        if status_code != 200:
             await interaction.response.send_message(
                 "❌ Ó meu, tu não tá cadastrado ainda não! Manda um `/register` aí primeiro! 😉", ephemeral=True
             )
+            return
+
+        total = data['total_attended']
+        if total == 0:
+            message = "📊 Rapaz, tu ainda não colou em nenhum rolê! Bora quebrar esse jejum! 😜"
+        elif total == 1:
+            message = "📊 Tu colou em 1 rolê! Tá começando a pegar o jeito! 🚀"
+        else:
+            message = f"📊 Ó o sinforoso! Tu já colou em {total} rolês! Tá viciado mesmo! 🔥🎉"
+
+        if active_status == 200 and active_events:
+            attended_ids = {event['id'] for event in data.get('attended_events', [])}
+            pending = [event for event in active_events if event['id'] not in attended_ids]
+            if pending:
+                message += f"\n👉 Tá rolando agora: **{pending[0]['title']}**! Manda um `/bater-ponto`!"
+
+        await interaction.response.send_message(message, ephemeral=True)
 
     @app_commands.command(
         name="create_event",
@@ -180,23 +368,19 @@ class EventsCog(commands.Cog):
         }
 
         data, status_code = await self.api_post(
-            f"/discord/events/create?discord_user_id={interaction.user.id}", json=event_data
+            "/discord/events/create",
+            json=event_data,
+            params={"discord_user_id": str(interaction.user.id)}
         )
 
         if status_code == 200:
+            self._invalidate("/discord/event")
             await interaction.response.send_message(
                 f"✅ Show! O rolê '{title}' tá criado e pronto pra bombar! Agora avisa a galera! 🎉🔥",
                 ephemeral=True
             )
-        elif status_code == 404:
-            await interaction.response.send_message(
-                "❌ Ô meu, tu não tá cadastrado! Manda um `/register` primeiro! 😅", ephemeral=True
-            )
-        elif status_code == 403:
-            await interaction.response.send_message(
-                "❌ Só os admins sinforosos podem criar rolê! Cola no `/make_admin 123` se tu for parça! 😎",
-                ephemeral=True
-            )
+        elif status_code in _CREATE_EVENT_ERRORS:
+            await interaction.response.send_message(_CREATE_EVENT_ERRORS[status_code], ephemeral=True)
         else:
             error_msg = data.get("detail", "Sei lá o que deu errado") if data else "API bugou"
             await interaction.response.send_message(
@@ -204,9 +388,9 @@ class EventsCog(commands.Cog):
             )
 
     @app_commands.command(name="event_status", description="Cola como tá o rolê")
-    async def slash_event_status(self, interaction: discord.Interaction, event_id: int):
+    async def slash_event_status(self, interaction: discord.Interaction, event_id: EventId):
         """Show event status."""
-        data, status_code = await self.api_get(f"/discord/event/{event_id}/status")
+        data, status_code = await self.api_get_cached(f"/discord/event/{event_id}/status", ttl=10)
         if status_code == 200:
             await interaction.response.send_message(
                 f"📋 **Como tá o rolê:**\n{data}", ephemeral=True
@@ -217,29 +401,29 @@ class EventsCog(commands.Cog):
             )
 
     @app_commands.command(name="event_attendees", description="Vê quem tá colando no rolê")
-    async def slash_event_attendees(self, interaction: discord.Interaction, event_id: int):
+    async def slash_event_attendees(self, interaction: discord.Interaction, event_id: EventId):
         """List event attendees."""
-        data, status_code = await self.api_get(f"/discord/event/{event_id}/attendees")
+        data, status_code = await self.api_get_cached(
+            f"/discord/event/{event_id}/attendees", ttl=15, interaction=interaction
+        )
         if status_code == 200:
             attendees = data.get("attendees", [])
             if attendees:
                 attendees_list = "\n".join([f"• {att['name']}" for att in attendees])
-                await interaction.response.send_message(
-                    f"👥 **Galera que tá no rolê:**\n{attendees_list}", ephemeral=True
-                )
+                await self._reply(interaction, f"👥 **Galera que tá no rolê:**\n{attendees_list}")
             else:
-                await interaction.response.send_message(
-                    "😢 Rapaz, ninguém marcou presença ainda! Bora ser o primeiro parça! 🚀", ephemeral=True
+                await self._reply(
+                    interaction, "😢 Rapaz, ninguém marcou presença ainda! Bora ser o primeiro parça! 🚀"
                 )
         else:
-            await interaction.response.send_message(
-                "❌ Não rolou pegar a lista de quem tá no rolê. Verifica se o ID tá certo! 🤷‍♂️", ephemeral=True
+            await self._reply(
+                interaction, "❌ Não rolou pegar a lista de quem tá no rolê. Verifica se o ID tá certo! 🤷‍♂️"
             )
 
     @app_commands.command(name="user_info", description="Cola teu perfil sinforoso")
     async def slash_user_info(self, interaction: discord.Interaction):
         """Show user profile information."""
-        data, status_code = await self.api_get(f"/discord/users/{interaction.user.id}")
+        data, status_code = await self.api_get_cached(f"/discord/users/{interaction.user.id}", ttl=0)
         if status_code == 200:
             await interaction.response.send_message(
                 f"👤 **Teu perfil no RolêDeQuinta:**\n{data}", ephemeral=True
@@ -258,6 +442,7 @@ class EventsCog(commands.Cog):
         })
 
         if status_code == 200:
+            self._admin_cache.pop(str(interaction.user.id), None)
             await interaction.response.send_message(
                 f"✅ {data.get('message', 'Opa! Agora tu é admin sinforoso!')} 👑🔥", ephemeral=True
             )
@@ -268,25 +453,7 @@ class EventsCog(commands.Cog):
     @app_commands.command(name="bothelp", description="Cola como usar o bot sinforoso")
     async def slash_bothelp(self, interaction: discord.Interaction):
         """Show bot help."""
-        help_text = '''🤖 **COMANDOS DO ROLÊDEQUINTA** (powered by sinforoso lifestyle)
-
-📝 `/register [nome]` - Se cadastra no rolê e define teu nome
-🔥 `/events` - Cola os rolês que tão bombando agora  
-✅ `/bater-ponto` - Marca presença no rolê que tá rolando
-📊 `/status` - Vê quantos rolês tu já colou na vida
-🔑 `/make_admin <senha>` - Vira admin sinforoso (precisa da senha secreta)
-➕ `/create_event` - Cria um rolê novo (só pros admins sinforosos)
-📋 `/event_status <id>` - Cola como tá o rolê
-👥 `/event_attendees <id>` - Vê quem tá colando no rolê  
-👤 `/user_info` - Cola teu perfil sinforoso
-🔊 `/avisar-role` - Avisa a galera sobre os próximos rolês (só ADM)
-🔥 `/bater-ponto-para <nome>` - Marca presença pra outro parça (só ADM)
-👥 `/listar-usuarios` - Lista toda a galera cadastrada (só ADM)
-❓ `/bothelp` - Mostra essa ajuda sinforosa
-
-**Dúvida? Fala com o grupo sinforoso lifestyle! 😎🔥**'''
-
-        await interaction.response.send_message(help_text, ephemeral=True)
+        await interaction.response.send_message(_HELP_TEXT, ephemeral=True)
 
     @app_commands.command(
         name="avisar-role",
@@ -294,26 +461,24 @@ class EventsCog(commands.Cog):
     )
     async def slash_avisar_role(self, interaction: discord.Interaction):
         """Notify about upcoming events (admin only)."""
-        # Check if user is admin
-        admin_data, admin_status = await self.api_post(
-            f"/discord/admin/check-admin?discord_user_id={interaction.user.id}"
+        # Check admin status and fetch the upcoming events concurrently; the
+        # events are simply discarded if the user turns out not to be admin
+        is_admin, (events_data, events_status) = await asyncio.gather(
+            self._is_admin(str(interaction.user.id)),
+            self.api_get_cached("/discord/events/upcoming", ttl=_LISTINGS_TTL),
         )
 
-        if admin_status != 200:
-            await interaction.response.send_message(
-                "❌ Ô meu, tu não tá cadastrado! Manda um `/register` primeiro! 😅", ephemeral=True
-            )
+        if is_admin is None:
+            await interaction.response.send_message(_NOT_REGISTERED_MSG, ephemeral=True)
             return
 
-        if not admin_data.get("is_admin", False):
+        if not is_admin:
             await interaction.response.send_message(
                 "❌ Só admin sinforoso pode avisar a galera! Cola no `/make_admin 123` se tu for parça! 😎",
                 ephemeral=True
             )
             return
 
-        # Get upcoming events
-        events_data, events_status = await self.api_get("/discord/events/upcoming")
         if events_status != 200 or not events_data:
             await interaction.response.send_message(
                 "❌ Não consegui pegar os próximos rolês, foi mal! API deve tá bugada! 🤷‍♂️", ephemeral=True
@@ -327,13 +492,7 @@ class EventsCog(commands.Cog):
             )
             return
 
-        # Find a chat channel
-        chat_channel = None
-        for channel in interaction.guild.channels:
-            if 'chat' in channel.name.lower() and hasattr(channel, 'send'):
-                chat_channel = channel
-                break
-
+        chat_channel = self._find_chat_channel(interaction.guild)
         if not chat_channel:
             await interaction.response.send_message(
                 "❌ Ó, não achei o canal #chat pra mandar o aviso! "
@@ -343,14 +502,12 @@ class EventsCog(commands.Cog):
             return
 
         # Create announcement message
-        announcement = "🎉 **PRÓXIMOS ROLÊS CONFIRMADOS, GALERA!** 🎉\n\n"
-        for event in events_data[:3]:  # Limit to 3 events
-            announcement += f"📅 **{event['title']}**\n"
-            announcement += f"📝 {event.get('description', 'Rolê sinforoso garantido!')}\n"
-            announcement += f"⏰ {event['start_time']}\n\n"
-
-        announcement += "🔥 **BORA QUE VAI SER SINFOROSO DEMAIS!** 🔥\n"
-        announcement += "💥 Usa `/register` pra se cadastrar e `/bater-ponto` durante o rolê!"
+        announcement = _ANNOUNCEMENT_HEADER + "".join(
+            f"📅 **{event['title']}**\n"
+            f"📝 {event.get('description', 'Rolê sinforoso garantido!')}\n"
+            f"⏰ {event['start_time']}\n\n"
+            for event in events_data[:3]  # Limit to 3 events
+        ) + _ANNOUNCEMENT_FOOTER
 
         # Send the announcement
         try:
@@ -377,28 +534,27 @@ class EventsCog(commands.Cog):
     )
     async def slash_listar_usuarios(self, interaction: discord.Interaction):
         """List all registered users (admin only)."""
-        # Check if user is admin first
-        admin_check_data, admin_status = await self.api_post(
-            f"/discord/admin/check-admin?discord_user_id={interaction.user.id}"
+        params = {"discord_user_id": str(interaction.user.id)}
+
+        # Check admin status and fetch the first page concurrently; the API
+        # reports the total separately, so only that page is shown
+        is_admin, (users_data, status) = await asyncio.gather(
+            self._is_admin(params["discord_user_id"]),
+            self.api_get(
+                "/discord/users/list", params={**params, "limit": _USER_LIST_LIMIT}
+            ),
         )
 
-        if admin_status != 200:
+        if is_admin is None:
             await interaction.response.send_message(
                 "❌ Só admin sinforoso pode ver a lista da galera! 😎", ephemeral=True
             )
             return
 
-        if not admin_check_data.get("is_admin", False):
-            await interaction.response.send_message(
-                "❌ Ô meu, tu não tá cadastrado! Manda um `/register` primeiro! 😅", ephemeral=True
-            )
+        if not is_admin:
+            await interaction.response.send_message(_NOT_REGISTERED_MSG, ephemeral=True)
             return
 
-        # Get user list
-        users_data, status = await self.api_get(
-            f"/discord/users/list?discord_user_id={interaction.user.id}"
-        )
-
         if status != 200:
             await interaction.response.send_message(
                 "❌ Deu ruim pra buscar a galera. API deve tá bugada! 🤷‍♂️", ephemeral=True
@@ -413,14 +569,16 @@ class EventsCog(commands.Cog):
             return
 
         # Format user list
-        user_list = "👥 **GALERA REGISTRADA NO ROLÊ:**\n\n"
-        for user in users[:20]:  # Limit to 20 users
+        lines = ["👥 **GALERA REGISTRADA NO ROLÊ:**\n"]
+        for user in users:
             admin_badge = " 👑" if user.get("is_admin") else ""
-            discord_name = f" (@{user.get('discord_username', 'N/A')})" if user.get('discord_username') else ""
-            user_list += f"• **{user['name']}**{admin_badge}{discord_name}\n"
+            discord_name = f" (@{user['discord_username']})" if user.get('discord_username') else ""
+            lines.append(f"• **{user['name']}**{admin_badge}{discord_name}")
 
-        if len(users) > 20:
-            user_list += f"\n... e mais {len(users) - 20} pessoa(s) sinforosa(s)! 🔥"
+        hidden = users_data.get("total", len(users)) - len(users)
+        if hidden > 0:
+            lines.append(f"\n... e mais {hidden} pessoa(s) sinforosa(s)! 🔥")
+        user_list = "\n".join(lines)
 
         await interaction.response.send_message(user_list, ephemeral=True)
 
@@ -429,7 +587,7 @@ class EventsCog(commands.Cog):
         description="Marca presença pra outro parça (só pros admins)"
     )
     async def slash_bater_ponto_para(
-        self, interaction: discord.Interaction, nome: str, evento_id: int = None
+        self, interaction: discord.Interaction, nome: str, evento_id: EventId = None
     ):
         """Mark attendance for another user (admin only)."""
         # Make API call to mark attendance
@@ -441,43 +599,29 @@ class EventsCog(commands.Cog):
         )
 
         if status == 200 and data.get("success"):
+            self._invalidate("/discord/event/")
+
             # Extract data for notifications
             admin_name = data.get("admin_user", {}).get("name", "Admin")
             target_name = data.get("target_user", {}).get("name", nome)
             target_discord = data.get("target_user", {}).get("discord_username", "")
             event_title = data.get("event", {}).get("title", "rolê")
 
-            # Send success message to admin
-            await interaction.response.send_message(
-                f"✅ Show! Ponto marcado pro **{target_name}** no rolê **{event_title}**! 🎊",
-                ephemeral=True
+            # Answer the admin and notify the public channel concurrently
+            await asyncio.gather(
+                interaction.response.send_message(
+                    f"✅ Show! Ponto marcado pro **{target_name}** no rolê **{event_title}**! 🎊",
+                    ephemeral=True
+                ),
+                self._notify_chat(
+                    interaction.guild,
+                    f"🎉 **{admin_name}** marcou ponto pro **{target_name}** "
+                    f"(@{target_discord}) no rolê **{event_title}**! Sinforoso demais! 🔥"
+                ),
             )
 
-            # Try to notify in a public channel
-            try:
-                chat_channel = None
-                for channel in interaction.guild.channels:
-                    if 'chat' in channel.name.lower() and hasattr(channel, 'send'):
-                        chat_channel = channel
-                        break
-
-                if chat_channel:
-                    notification = (
-                        f"🎉 **{admin_name}** marcou ponto pro **{target_name}** "
-                        f"(@{target_discord}) no rolê **{event_title}**! Sinforoso demais! 🔥"
-                    )
-                    await chat_channel.send(notification)
-            except Exception:
-                pass  # Ignore notification errors
-
-        elif status == 403:
-            await interaction.response.send_message(
-                "❌ Só admin sinforoso pode marcar ponto pros outros! 😎", ephemeral=True
-            )
-        elif status == 404:
-            await interaction.response.send_message(
-                "❌ Ô meu, tu não tá cadastrado! Manda um `/register` primeiro! 😅", ephemeral=True
-            )
+        elif status in _ATTEND_FOR_USER_ERRORS:
+            await interaction.response.send_message(_ATTEND_FOR_USER_ERRORS[status], ephemeral=True)
         else:
             error_msg = data.get("message", "Sei lá o que deu errado") if data else "API bugou"
             await interaction.response.send_message(f"❌ {error_msg} 😔", ephemeral=True) 
\ No newline at end of file
@@ -4,6 +4,7 @@ Configuration module for the Discord Bot.
 This module handles all environment variable configuration for the bot.
 """
 
+import functools
 import logging
 import os
 import sys
@@ -14,6 +15,8 @@ from dataclasses import dataclass
 class BotConfig:
     """Configuration class for Discord bot settings."""
 
+    __slots__ = ("token", "api_base_url", "guild_id")
+
     def __init__(self):
         """Initialize bot configuration from environment variables."""
         self.token = os.getenv("DISCORD_TOKEN")
@@ -25,8 +28,18 @@ class BotConfig:
             raise ValueError("DISCORD_TOKEN environment variable is required")
 
 
+@functools.lru_cache(maxsize=1)
+def get_config() -> BotConfig:
+    """The bot configuration, read from the environment on first use."""
+    return BotConfig()
+
+
 def setup_logging() -> logging.Logger:
-    """Set up logging configuration for the Discord bot."""
+    """Set up logging configuration for the Discord bot (once per process)."""
+    if logging.getLogger().handlers:
+        # Already configured; basicConfig would ignore new handlers anyway,
+        # but only after opening another handle on the log file
+        return logging.getLogger(__name__)
     logging.basicConfig(
         level=logging.INFO,
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
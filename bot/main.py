@@ -8,19 +8,21 @@ RolêDeQuinta event attendance system.
 import asyncio
 import logging
 import sys
+from typing import Optional
 
 import aiohttp
 import discord
+import orjson
 from discord.ext import commands
 
 from bot.cogs.events import EventsCog
-from bot.config import BotConfig, setup_logging
+from bot.config import get_config, setup_logging
 
 
 async def main():
     """Main entry point for the Discord bot."""
     # Initialize configuration and logging
-    config = BotConfig()
+    config = get_config()
     logger = setup_logging()
 
     # Create and run the bot
@@ -40,13 +42,14 @@ class SNFRSBot(commands.Bot):
     
     def __init__(self):
         """Initialize the Discord bot with proper configuration."""
-        self.config = BotConfig()
+        self.config = get_config()
         self.logger = setup_logging()
         
         intents = discord.Intents.default()
         intents.message_content = True
         
         super().__init__(command_prefix="!", intents=intents)
+        self.http_session: Optional[aiohttp.ClientSession] = None  # Opened in setup_hook
         
         self.logger.info("🚀 Starting Discord Bot...")
         self.logger.info(f"API Base URL: {self.config.api_base_url}")
@@ -58,10 +61,28 @@ class SNFRSBot(commands.Bot):
 
     async def setup_hook(self):
         """Set up the bot with cogs and sync commands."""
+        # One pooled session to the API, shared by every cog
+        self.http_session = aiohttp.ClientSession(
+            # A few warm keep-alive connections to the one API host; idle
+            # ones are dropped before the API's 75s keep-alive closes them
+            connector=aiohttp.TCPConnector(
+                limit=32, ttl_dns_cache=300, keepalive_timeout=60
+            ),
+            # Fail fast rather than hold an interaction until it expires
+            timeout=aiohttp.ClientTimeout(total=10, connect=2, sock_read=8),
+            json_serialize=lambda obj: orjson.dumps(obj).decode(),
+        )
+
         self.logger.info("🔧 Adding EventsCog to bot...")
         await self.add_cog(EventsCog(self))
         self.logger.info("✅ Cog added successfully")
 
+    async def close(self):
+        """Close the API session along with the Discord connection."""
+        await super().close()
+        if self.http_session is not None:
+            await self.http_session.close()
+
     async def on_ready(self):
         """Event handler for when the bot is ready."""
         self.logger.info(f"🎉 Bot logged in as {self.user} (ID: {self.user.id})")
@@ -86,12 +107,13 @@ class SNFRSBot(commands.Bot):
         """Test the connection to the API."""
         try:
             self.logger.info("🔗 Testing API connection...")
-            async with aiohttp.ClientSession() as session:
-                async with session.get(f"{self.config.api_base_url}/health") as resp:
-                    if resp.status == 200:
-                        self.logger.info("✅ API connection successful")
-                    else:
-                        self.logger.warning(f"⚠️ API connection issue: HTTP {resp.status}")
+            # Through the shared session, so the connection stays warm for
+            # the first command
+            async with self.http_session.get(f"{self.config.api_base_url}/health") as resp:
+                if resp.status == 200:
+                    self.logger.info("✅ API connection successful")
+                else:
+                    self.logger.warning(f"⚠️ API connection issue: HTTP {resp.status}")
         except Exception as e:
             self.logger.error(f"❌ API connection failed: {e}")
 
@@ -100,16 +122,23 @@ class SNFRSBot(commands.Bot):
         try:
             self.logger.info("⚙️ Syncing slash commands...")
             
-            # Sync to all guilds for immediate availability
-            for guild in self.guilds:
-                try:
-                    synced_guild = await self.tree.sync(guild=guild)
+            # Sync to all guilds for immediate availability, and globally
+            # (takes up to 1 hour to propagate), all at once; discord.py's
+            # rate limiter queues the requests as needed
+            guilds = list(self.guilds)
+            guild_results, synced_global = await asyncio.gather(
+                asyncio.gather(
+                    *(self.tree.sync(guild=guild) for guild in guilds),
+                    return_exceptions=True
+                ),
+                self.tree.sync(),
+            )
+            for guild, synced_guild in zip(guilds, guild_results):
+                if isinstance(synced_guild, Exception):
+                    self.logger.error(f"❌ Failed to sync to guild {guild.name}: {synced_guild}")
+                else:
                     self.logger.info(f"✅ Synced {len(synced_guild)} commands to guild: {guild.name}")
-                except Exception as guild_e:
-                    self.logger.error(f"❌ Failed to sync to guild {guild.name}: {guild_e}")
             
-            # Also sync globally (takes up to 1 hour to propagate)
-            synced_global = await self.tree.sync()
             self.logger.info(f"✅ Global slash commands synchronized: {len(synced_global)} commands")
             
             for cmd in synced_global:
@@ -3,6 +3,7 @@ from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
+from app.auth import create_access_token
 from app.database import Base, get_db
 from app.main import app
 
@@ -101,4 +102,25 @@ def test_login_invalid_credentials():
         auth=("invalid@example.com", "wrongpassword")
     )
     assert response.status_code == 401
-    assert "Incorrect email or password" in response.json()["detail"] 
\ No newline at end of file
+    assert "Incorrect email or password" in response.json()["detail"] 
+
+def test_token_without_user_claims():
+    # Tokens issued before the uid claim existed are resolved by email
+    client.post(
+        "/auth/register",
+        json={
+            "email": "test@example.com",
+            "name": "Test User",
+            "password": "testpassword123"
+        }
+    )
+    token = create_access_token(data={"sub": "test@example.com"})
+    headers = {"Authorization": f"Bearer {token}"}
+
+    response = client.get("/users/me", headers=headers)
+    assert response.status_code == 200
+    user_id = response.json()["id"]
+
+    response = client.get("/events/999/check-attendance", headers=headers)
+    assert response.status_code == 200
+    assert response.json()["user_id"] == user_id
@@ -0,0 +1,467 @@
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app import crud, models
+from app.database import Base, get_db
+from app.main import app
+
+# Test database
+SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
+engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+def override_get_db():
+    try:
+        db = TestingSessionLocal()
+        yield db
+    finally:
+        db.close()
+
+
+app.dependency_overrides[get_db] = override_get_db
+
+client = TestClient(app)
+
+
+@pytest.fixture(scope="function", autouse=True)
+def setup_database():
+    Base.metadata.create_all(bind=engine)
+    crud.clear_event_caches()  # Events are also inserted directly below
+    yield
+    Base.metadata.drop_all(bind=engine)
+
+
+class TestBulkRegistration:
+    """Test bulk Discord user registration"""
+
+    def test_bulk_register_creates_users(self):
+        """Test registering several new users in one call"""
+        response = client.post(
+            "/discord/users/register/bulk",
+            json=[
+                {"name": "One", "discord_user_id": "1", "discord_username": "one"},
+                {"name": "Two", "discord_user_id": "2", "discord_username": "two"},
+            ]
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert sorted(user["name"] for user in data) == ["One", "Two"]
+        assert all(user["is_active"] for user in data)
+        assert not any(user["is_admin"] for user in data)
+
+    def test_bulk_register_updates_existing_users(self):
+        """Test that known Discord ids are updated instead of duplicated"""
+        client.post(
+            "/discord/users/register",
+            json={
+                "name": "Old Name",
+                "discord_user_id": "1",
+                "discord_username": "old",
+                "email": "one@example.com"
+            }
+        )
+
+        response = client.post(
+            "/discord/users/register/bulk",
+            json=[
+                {"name": "New Name", "discord_user_id": "1", "discord_username": "new"},
+                {"name": "Two", "discord_user_id": "2", "discord_username": "two"},
+            ]
+        )
+        assert response.status_code == 200
+        users = {user["discord_user_id"]: user for user in response.json()}
+        assert users["1"]["name"] == "New Name"
+        assert users["1"]["discord_username"] == "new"
+        assert users["1"]["email"] == "one@example.com"
+
+        user = client.get("/discord/users/1").json()
+        assert user["name"] == "New Name"
+
+
+    def test_bulk_register_repeated_discord_id(self):
+        """Test that a Discord id repeated in a batch is upserted once, last entry winning"""
+        response = client.post(
+            "/discord/users/register/bulk",
+            json=[
+                {"name": "First", "discord_user_id": "1", "discord_username": "first"},
+                {"name": "Second", "discord_user_id": "1", "discord_username": "second"},
+            ]
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data) == 1
+        assert data[0]["name"] == "Second"
+
+    def test_bulk_register_taken_name(self):
+        """Test that a name owned by another user is a conflict, not a server error"""
+        client.post(
+            "/discord/users/register",
+            json={"name": "Taken", "discord_user_id": "1", "discord_username": "one"}
+        )
+
+        response = client.post(
+            "/discord/users/register/bulk",
+            json=[
+                {"name": "Two", "discord_user_id": "2", "discord_username": "two"},
+                {"name": "Taken", "discord_user_id": "3", "discord_username": "three"},
+            ]
+        )
+        assert response.status_code == 409
+        assert client.get("/discord/users/2").status_code == 404
+
+    def test_bulk_register_size_limit(self):
+        """Test that oversized batches are rejected before touching the database"""
+        response = client.post(
+            "/discord/users/register/bulk",
+            json=[
+                {"name": f"User {i}", "discord_user_id": str(i), "discord_username": f"user{i}"}
+                for i in range(101)
+            ]
+        )
+        assert response.status_code == 422
+
+
+class TestUserListTotal:
+    """Test the total reported by the admin user listing"""
+
+    def test_total_counts_beyond_page(self):
+        """Test that total counts every active user, not just the page"""
+        client.post(
+            "/discord/users/register/bulk",
+            json=[
+                {"name": f"User {i}", "discord_user_id": str(i), "discord_username": f"user{i}"}
+                for i in range(1, 4)
+            ]
+        )
+        client.post(
+            "/discord/admin/make-admin",
+            json={"discord_user_id": "1", "password": "123"}
+        )
+
+        response = client.get(
+            "/discord/users/list",
+            params={"discord_user_id": "1", "limit": 1}
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data["users"]) == 1
+        assert data["total"] == 3
+
+
+@pytest.fixture
+def attended_event():
+    """An ongoing event attended by one Discord user and one web user"""
+    db = TestingSessionLocal()
+    user = models.User(name="Attendee", discord_user_id="42", discord_username="attendee")
+    now = datetime.now()
+    event = models.Event(
+        title="Ongoing",
+        start_time=now - timedelta(hours=1),
+        end_time=now + timedelta(hours=1),
+        creator=user
+    )
+    db.add(event)
+    db.flush()
+    web_user = models.User(name="Web", email="web@example.com")
+    db.add(web_user)
+    db.flush()
+    db.execute(
+        models.user_event_attendance.insert(),
+        [{"user_id": user.id, "event_id": event.id},
+         {"user_id": web_user.id, "event_id": event.id}]
+    )
+    db.commit()
+    event_id = event.id
+    db.close()
+    return event_id
+
+
+class TestAttendanceListings:
+    """Test the Discord attendance listings"""
+
+    def test_user_attendance_history(self, attended_event):
+        """Test listing the events a Discord user attended"""
+        response = client.get("/discord/attendance/42")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total_attended"] == 1
+        assert data["attended_events"][0]["id"] == attended_event
+        assert data["attended_events"][0]["title"] == "Ongoing"
+
+    def test_event_attendees(self, attended_event):
+        """Test that only Discord attendees are listed and counted"""
+        response = client.get(f"/discord/event/{attended_event}/attendees")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total_attendees"] == 1
+        assert data["attendees"] == [
+            {"name": "Attendee", "discord_username": "attendee", "discord_user_id": "42"}
+        ]
+
+    def test_iter_event_attendees_batches(self, attended_event):
+        """Test that attendees are read back in batches of the requested size"""
+        client.post(
+            "/discord/users/register",
+            json={"name": "Late", "discord_user_id": "7", "discord_username": "late"}
+        )
+        client.post(f"/discord/attend/{attended_event}", params={"discord_user_id": "7"})
+
+        db = TestingSessionLocal()
+        try:
+            batches = [
+                [row["name"] for row in batch]
+                for batch in crud.iter_event_attendees(db, attended_event, batch_size=1)
+            ]
+        finally:
+            db.close()
+        assert sorted(batches) == [["Attendee"], ["Late"], ["Web"]]
+
+    def test_event_attendees_unknown_event(self):
+        """Test listing attendees of a missing event"""
+        response = client.get("/discord/event/999/attendees")
+        assert response.status_code == 404
+
+
+class TestStatusBatch:
+    """Test the batched Discord event status endpoint"""
+
+    def test_status_batch(self, attended_event):
+        """Test statuses and attendance for several events in one call"""
+        response = client.post(
+            "/events/discord/status-batch",
+            json={"discord_user_id": "42", "event_ids": [attended_event, 999]}
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data) == 1
+        assert data[0]["event_id"] == attended_event
+        assert data[0]["can_attend"] is True
+        assert data[0]["attended"] is True
+
+        response = client.post(
+            "/events/discord/status-batch",
+            json={"discord_user_id": "999", "event_ids": [attended_event]}
+        )
+        assert response.json()[0]["attended"] is False
+
+    def test_status_batch_too_many_events(self):
+        """Test that the batch size is capped"""
+        response = client.post(
+            "/events/discord/status-batch",
+            json={"discord_user_id": "42", "event_ids": list(range(101))}
+        )
+        assert response.status_code == 422
+
+
+class TestAttendEvent:
+    """Test attending an event by id via Discord"""
+
+    def test_attend_ongoing_event(self, attended_event):
+        """Test that a registered user can attend an ongoing event once"""
+        client.post(
+            "/discord/users/register",
+            json={"name": "Late", "discord_user_id": "7", "discord_username": "late"}
+        )
+        response = client.post(
+            f"/discord/attend/{attended_event}",
+            params={"discord_user_id": "7"}
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["success"] is True
+        assert data["event"]["title"] == "Ongoing"
+        assert data["user"]["name"] == "Late"
+
+        response = client.post(
+            f"/discord/attend/{attended_event}",
+            params={"discord_user_id": "7"}
+        )
+        assert response.json()["success"] is False
+        assert response.json()["message"] == "Already marked as attended"
+
+    def test_check_attendance_after_attending(self, attended_event):
+        """Test that the attendance check sees a fresh attendance"""
+        client.post(
+            "/discord/users/register",
+            json={"name": "Late", "discord_user_id": "7", "discord_username": "late"}
+        )
+        url = f"/events/discord/7/{attended_event}/check-attendance"
+        assert client.get(url).json()["attended"] is False
+
+        client.post(f"/discord/attend/{attended_event}", params={"discord_user_id": "7"})
+        assert client.get(url).json()["attended"] is True
+        assert client.get(
+            f"/events/discord/999/{attended_event}/check-attendance"
+        ).json()["attended"] is False
+
+    def test_attend_by_body(self, attended_event):
+        """Test the body-based Discord attendance endpoint"""
+        client.post(
+            "/discord/users/register",
+            json={"name": "Late", "discord_user_id": "7", "discord_username": "late"}
+        )
+        body = {"discord_user_id": "7", "event_id": attended_event}
+        response = client.post("/events/discord/attend", json=body)
+        assert response.status_code == 200
+        assert response.json()["user"]["name"] == "Late"
+
+        response = client.post("/events/discord/attend", json=body)
+        assert response.status_code == 400
+        assert response.json()["detail"]["error"] == "Already marked as attended"
+
+        response = client.post(
+            "/events/discord/attend", json={"discord_user_id": "999", "event_id": attended_event}
+        )
+        assert response.status_code == 404
+
+    def test_attend_unknown_event(self, attended_event):
+        """Test attending a missing event"""
+        response = client.post("/discord/attend/999", params={"discord_user_id": "42"})
+        assert response.status_code == 404
+        assert response.json()["detail"] == "Event not found"
+
+    def test_attend_unregistered_user(self, attended_event):
+        """Test attending without being registered"""
+        response = client.post(
+            f"/discord/attend/{attended_event}",
+            params={"discord_user_id": "999"}
+        )
+        assert response.status_code == 404
+        assert "not registered" in response.json()["detail"]
+
+
+class TestCreateEvent:
+    """Test creating events via Discord"""
+
+    @pytest.fixture
+    def event_payload(self):
+        start = datetime.now() + timedelta(days=1)
+        return {
+            "title": "Meetup",
+            "start_time": start.isoformat(),
+            "end_time": (start + timedelta(hours=2)).isoformat(),
+            "discord_channel_id": "555"
+        }
+
+    def test_create_event_as_admin(self, event_payload):
+        """Test that an admin creates an event owned by them"""
+        registered = client.post(
+            "/discord/users/register",
+            json={"name": "Admin", "discord_user_id": "1", "discord_username": "admin"}
+        ).json()
+        client.post(
+            "/discord/admin/make-admin",
+            json={"discord_user_id": "1", "password": "123"}
+        )
+
+        response = client.post(
+            "/discord/events/create",
+            json=event_payload,
+            params={"discord_user_id": "1"}
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["title"] == "Meetup"
+        assert data["is_active"] is True
+        assert data["user_id"] == registered["user"]["id"]
+
+        response = client.get("/discord/events/channel/555")
+        assert [event["title"] for event in response.json()] == ["Meetup"]
+
+    def test_create_event_as_non_admin(self, event_payload):
+        """Test that regular users cannot create events"""
+        client.post(
+            "/discord/users/register",
+            json={"name": "User", "discord_user_id": "2", "discord_username": "user"}
+        )
+        response = client.post(
+            "/discord/events/create",
+            json=event_payload,
+            params={"discord_user_id": "2"}
+        )
+        assert response.status_code == 403
+
+    def test_create_event_unregistered(self, event_payload):
+        """Test creating an event without being registered"""
+        response = client.post(
+            "/discord/events/create",
+            json=event_payload,
+            params={"discord_user_id": "999"}
+        )
+        assert response.status_code == 404
+
+
+class TestCheckAdmin:
+    """Test the Discord admin status check"""
+
+    def test_check_admin_status(self):
+        """Test the flag before and after becoming admin"""
+        client.post(
+            "/discord/users/register",
+            json={"name": "Someone", "discord_user_id": "3", "discord_username": "someone"}
+        )
+        response = client.post("/discord/admin/check-admin", params={"discord_user_id": "3"})
+        assert response.status_code == 200
+        assert response.json() == {
+            "is_admin": False,
+            "user_name": "Someone",
+            "discord_username": "someone"
+        }
+
+        client.post(
+            "/discord/admin/make-admin",
+            json={"discord_user_id": "3", "password": "123"}
+        )
+        response = client.post("/discord/admin/check-admin", params={"discord_user_id": "3"})
+        assert response.json()["is_admin"] is True
+
+    def test_check_admin_unregistered(self):
+        """Test checking an unknown Discord user"""
+        response = client.post("/discord/admin/check-admin", params={"discord_user_id": "999"})
+        assert response.status_code == 404
+
+
+class TestAutoAttend:
+    """Test attending the single ongoing event via Discord"""
+
+    def test_auto_attend(self, attended_event):
+        """Test attending the ongoing event, then attending again"""
+        client.post(
+            "/discord/users/register",
+            json={"name": "Late", "discord_user_id": "7", "discord_username": "late"}
+        )
+        response = client.post("/discord/attend/auto", params={"discord_user_id": "7"})
+        assert response.status_code == 200
+        data = response.json()
+        assert data["success"] is True
+        assert data["event"]["id"] == attended_event
+        assert data["event"]["end_time"]
+        assert data["user"] == {"name": "Late", "discord_username": "late"}
+
+        response = client.post("/discord/attend/auto", params={"discord_user_id": "7"})
+        data = response.json()
+        assert data["success"] is True
+        assert "já bateu ponto" in data["message"]
+
+    def test_auto_attend_unregistered(self, attended_event):
+        """Test auto attend without being registered"""
+        response = client.post("/discord/attend/auto", params={"discord_user_id": "999"})
+        data = response.json()
+        assert data["success"] is False
+        assert "registrado" in data["message"]
+
+    def test_auto_attend_without_ongoing_event(self):
+        """Test auto attend when nothing is happening"""
+        client.post(
+            "/discord/users/register",
+            json={"name": "Early", "discord_user_id": "8", "discord_username": "early"}
+        )
+        response = client.post("/discord/attend/auto", params={"discord_user_id": "8"})
+        data = response.json()
+        assert data["success"] is False
+        assert "Nenhum evento" in data["message"]
@@ -1,5 +1,5 @@
 import pytest
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
@@ -60,7 +60,8 @@ def test_create_event(auth_headers):
         json={
             "title": "Thursday Meetup",
             "description": "Weekly Thursday meetup",
-            "event_date": event_date.isoformat()
+            "start_time": event_date.isoformat(),
+            "end_time": (event_date + timedelta(hours=2)).isoformat()
         },
         headers=auth_headers
     )
@@ -79,7 +80,8 @@ def test_get_events(auth_headers):
         json={
             "title": "Thursday Meetup",
             "description": "Weekly Thursday meetup",
-            "event_date": event_date.isoformat()
+            "start_time": event_date.isoformat(),
+            "end_time": (event_date + timedelta(hours=2)).isoformat()
         },
         headers=auth_headers
     )
@@ -91,15 +93,23 @@ def test_get_events(auth_headers):
     assert data[0]["title"] == "Thursday Meetup"
 
 
+def test_get_events_page_size_bounded(auth_headers):
+    response = client.get("/events/?limit=101", headers=auth_headers)
+    assert response.status_code == 422
+    response = client.get("/events/?skip=-1", headers=auth_headers)
+    assert response.status_code == 422
+
+
 def test_mark_attendance(auth_headers):
     # Create an event first
-    event_date = datetime.now() + timedelta(days=7)
+    event_date = datetime.now() - timedelta(hours=1)  # Ongoing
     event_response = client.post(
         "/events/",
         json={
             "title": "Thursday Meetup",
             "description": "Weekly Thursday meetup",
-            "event_date": event_date.isoformat()
+            "start_time": event_date.isoformat(),
+            "end_time": (event_date + timedelta(hours=2)).isoformat()
         },
         headers=auth_headers
     )
@@ -118,13 +128,14 @@ def test_mark_attendance(auth_headers):
 
 def test_check_attendance(auth_headers):
     # Create an event first
-    event_date = datetime.now() + timedelta(days=7)
+    event_date = datetime.now() - timedelta(hours=1)  # Ongoing
     event_response = client.post(
         "/events/",
         json={
             "title": "Thursday Meetup",
             "description": "Weekly Thursday meetup",
-            "event_date": event_date.isoformat()
+            "start_time": event_date.isoformat(),
+            "end_time": (event_date + timedelta(hours=2)).isoformat()
         },
         headers=auth_headers
     )
@@ -150,6 +161,31 @@ def test_check_attendance(auth_headers):
     assert response.json()["attended"] is True
 
 
+def test_attendance_listings(auth_headers):
+    # Create an ongoing event and attend it
+    event_date = datetime.now() - timedelta(hours=1)  # Ongoing
+    event_response = client.post(
+        "/events/",
+        json={
+            "title": "Thursday Meetup",
+            "description": "Weekly Thursday meetup",
+            "start_time": event_date.isoformat(),
+            "end_time": (event_date + timedelta(hours=2)).isoformat()
+        },
+        headers=auth_headers
+    )
+    event_id = event_response.json()["id"]
+    client.post(f"/events/{event_id}/attend", headers=auth_headers)
+
+    response = client.get(f"/events/{event_id}/attendees", headers=auth_headers)
+    assert response.status_code == 200
+    assert [user["email"] for user in response.json()] == ["test@example.com"]
+
+    response = client.get("/users/me/events", headers=auth_headers)
+    assert response.status_code == 200
+    assert [event["id"] for event in response.json()] == [event_id]
+
+
 def test_get_upcoming_events(auth_headers):
     # Create past and future events
     past_date = datetime.now() - timedelta(days=7)
@@ -160,7 +196,8 @@ def test_get_upcoming_events(auth_headers):
         json={
             "title": "Past Event",
             "description": "Past event",
-            "event_date": past_date.isoformat()
+            "start_time": past_date.isoformat(),
+            "end_time": (past_date + timedelta(hours=2)).isoformat()
         },
         headers=auth_headers
     )
@@ -170,7 +207,8 @@ def test_get_upcoming_events(auth_headers):
         json={
             "title": "Future Event",
             "description": "Future event",
-            "event_date": future_date.isoformat()
+            "start_time": future_date.isoformat(),
+            "end_time": (future_date + timedelta(hours=2)).isoformat()
         },
         headers=auth_headers
     )
@@ -182,6 +220,65 @@ def test_get_upcoming_events(auth_headers):
     assert data[0]["title"] == "Future Event"
 
 
+def test_update_event_end_before_stored_start(auth_headers):
+    event_date = datetime.now() + timedelta(days=7)
+    event_id = client.post(
+        "/events/",
+        json={
+            "title": "Thursday Meetup",
+            "start_time": event_date.isoformat(),
+            "end_time": (event_date + timedelta(hours=2)).isoformat()
+        },
+        headers=auth_headers
+    ).json()["id"]
+
+    response = client.put(
+        f"/events/{event_id}",
+        json={"end_time": (event_date - timedelta(hours=1)).isoformat()},
+        headers=auth_headers
+    )
+    assert response.status_code == 422
+
+    response = client.put(
+        f"/events/{event_id}",
+        json={"end_time": (event_date + timedelta(hours=3)).isoformat()},
+        headers=auth_headers
+    )
+    assert response.status_code == 200
+    assert response.json()["end_time"].startswith(
+        (event_date + timedelta(hours=3)).isoformat()[:19]
+    )
+
+
+def test_update_event_aware_end_time(auth_headers):
+    event_date = datetime.now() + timedelta(days=7)
+    event_id = client.post(
+        "/events/",
+        json={
+            "title": "Thursday Meetup",
+            "start_time": event_date.isoformat(),
+            "end_time": (event_date + timedelta(hours=2)).isoformat()
+        },
+        headers=auth_headers
+    ).json()["id"]
+
+    new_end = (event_date + timedelta(hours=3)).astimezone(timezone.utc)
+    response = client.put(
+        f"/events/{event_id}",
+        json={"end_time": new_end.isoformat().replace("+00:00", "Z")},
+        headers=auth_headers
+    )
+    assert response.status_code == 200
+
+    early_end = (event_date - timedelta(hours=1)).astimezone(timezone.utc)
+    response = client.put(
+        f"/events/{event_id}",
+        json={"end_time": early_end.isoformat().replace("+00:00", "Z")},
+        headers=auth_headers
+    )
+    assert response.status_code == 422
+
+
 def test_unauthorized_access():
     response = client.get("/events/")
     assert response.status_code == 401 
\ No newline at end of file